@@ -18,6 +18,9 @@ DATABASES = {
         "PORT": os.getenv("POSTGRES_DB_PORT", 5432),
         "OPTIONS": {
             "sslmode": "require",
+            # JIT compilation costs more than it saves on the small,
+            # many-joined queries the admin and list views issue
+            "options": "-c jit=off",
         },
     }
 }
@@ -0,0 +1,34 @@
+from .base import *
+
+
+# No TEST NAME is set, so the test runner builds this database in memory
+# rather than in db.sqlite3. The suite uses no PostgreSQL-only features.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",
+    }
+}
+
+# The suite creates many users; the default PBKDF2 hasher is deliberately
+# slow and adds nothing to what the tests check.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+# Password strength rules are not under test; CommonPasswordValidator in
+# particular loads a large word list on first use.
+AUTH_PASSWORD_VALIDATORS = []
+
+
+class DisableMigrations:
+    """Build the test database straight from the models."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
@@ -1,5 +1,13 @@
+import csv
+from itertools import chain
+
 from django.contrib import admin
+from django.contrib.admin.utils import lookup_spawns_duplicates
 from django.contrib.auth.admin import UserAdmin
+from django.db import connection
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils.text import smart_split, unescape_string_literal
 from .models import (
     Worker,
     Position,
@@ -11,9 +19,81 @@ from .models import (
     Comment,
     ActivityLog,
     Notification,
+    prefix_search_query,
 )
 
 
+def is_change_view(request, opts):
+    """Return whether ``request`` resolved to the change view of ``opts``."""
+    match = request.resolver_match
+    return (
+        match is not None
+        and match.url_name == f"{opts.app_label}_{opts.model_name}_change"
+    )
+
+
+class Echo:
+    """File-like object that hands each written CSV row straight back."""
+
+    def write(self, value):
+        return value
+
+
+class SearchVectorAdminMixin:
+    """Search the model's own text fields through its search_vector.
+
+    On PostgreSQL each word of the search term is prefix-matched against
+    the GIN-indexed ``search_vector`` column instead of
+    ``ILIKE '%word%'`` on every local field. Related lookups
+    (``task__name``) still use ``icontains``. As in the default admin
+    search, every word must match. Other backends fall back to the
+    default admin search.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term or connection.vendor != "postgresql":
+            return super().get_search_results(request, queryset, search_term)
+
+        related_fields = [
+            field for field in self.get_search_fields(request) if "__" in field
+        ]
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            condition = Q()
+            search_query = prefix_search_query(bit)
+            if search_query is not None:
+                condition |= Q(search_vector=search_query)
+            for field in related_fields:
+                condition |= Q(**{f"{field}__icontains": bit})
+            if condition:
+                queryset = queryset.filter(condition)
+
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, field)
+            for field in related_fields
+        )
+        return queryset, may_have_duplicates
+
+
+class ListSelectRelatedAdminMixin:
+    """Join exactly ``list_select_related``, not the manager's defaults.
+
+    The Comment, ActivityLog and Notification managers already call
+    ``select_related``, and the changelist only applies
+    ``list_select_related`` to a queryset that has none yet, so the
+    deeper ``__position`` joins would otherwise be dropped.
+    """
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .select_related(None)
+            .select_related(*self.list_select_related)
+        )
+
+
 class WorkerAdmin(UserAdmin):
     """Worker administration."""
 
@@ -27,6 +107,7 @@ class WorkerAdmin(UserAdmin):
         "is_staff",
     ]
     list_filter = ["position", "is_staff", "is_active"]
+    list_select_related = ["position"]
     search_fields = ["username", "email", "first_name", "last_name"]
     ordering = ["username"]
 
@@ -58,7 +139,7 @@ class TaskTypeAdmin(admin.ModelAdmin):
 
 
 @admin.register(Task)
-class TaskAdmin(admin.ModelAdmin):
+class TaskAdmin(SearchVectorAdminMixin, admin.ModelAdmin):
     """Task administration."""
 
     list_display = [
@@ -71,9 +152,11 @@ class TaskAdmin(admin.ModelAdmin):
         "created_at",
     ]
     list_filter = ["is_completed", "priority", "task_type", "created_at"]
+    list_select_related = ["task_type", "created_by__position"]
     search_fields = ["name", "description"]
     date_hierarchy = "created_at"
     filter_horizontal = ["assignees", "tags"]
+    autocomplete_fields = ["project", "created_by", "task_type"]
     readonly_fields = ["created_at", "updated_at"]
 
     fieldsets = (
@@ -96,6 +179,22 @@ class TaskAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        """Load the assignees and tags only for the change form.
+
+        The changelist skips the description body it does not show.
+        """
+        queryset = super().get_queryset(request)
+        if is_change_view(request, self.opts):
+            return queryset.prefetch_related("assignees", "tags")
+        return queryset.defer("description")
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        """Join the position each assignee choice prints in its label."""
+        if db_field.name == "assignees":
+            kwargs["queryset"] = Worker.objects.select_related("position")
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
@@ -121,31 +220,40 @@ class TeamAdmin(admin.ModelAdmin):
 
     list_display = ["name", "project"]
     list_filter = ["project"]
+    list_select_related = ["project"]
     search_fields = ["name"]
     filter_horizontal = ["members"]
+    autocomplete_fields = ["project"]
+
+    def get_queryset(self, request):
+        """Prefetch the members only for the change form."""
+        queryset = super().get_queryset(request)
+        if is_change_view(request, self.opts):
+            return queryset.prefetch_related("members")
+        return queryset
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(ListSelectRelatedAdminMixin,
+                   SearchVectorAdminMixin,
+                   admin.ModelAdmin):
     """Comment administration."""
 
     list_display = ["task", "author", "created_at", "content_preview"]
     list_filter = ["created_at"]
+    list_select_related = ["task", "author__position"]
     search_fields = ["content", "task__name", "author__username"]
+    autocomplete_fields = ["task", "author"]
     date_hierarchy = "created_at"
     readonly_fields = ["created_at", "updated_at"]
 
-    def content_preview(self, obj):
-        """Show first 50 characters of the comment."""
-        if len(obj.content) > 50:
-            return obj.content[:50] + "..."
-        return obj.content
-
-    content_preview.short_description = "Content"
+    def get_queryset(self, request):
+        """Skip the comment body; the changelist shows content_preview."""
+        return super().get_queryset(request).defer("content")
 
 
 @admin.register(ActivityLog)
-class ActivityLogAdmin(admin.ModelAdmin):
+class ActivityLogAdmin(ListSelectRelatedAdminMixin, admin.ModelAdmin):
     """Activity log administration."""
 
     list_display = [
@@ -156,6 +264,7 @@ class ActivityLogAdmin(admin.ModelAdmin):
         "description_preview",
     ]
     list_filter = ["activity_type", "created_at"]
+    list_select_related = ["task", "user__position"]
     search_fields = ["description", "task__name", "user__username"]
     date_hierarchy = "created_at"
     readonly_fields = ["task",
@@ -164,13 +273,33 @@ class ActivityLogAdmin(admin.ModelAdmin):
                        "description",
                        "created_at"]
 
-    def description_preview(self, obj):
-        """Show first 50 characters of the description."""
-        if len(obj.description) > 50:
-            return obj.description[:50] + "..."
-        return obj.description
-
-    description_preview.short_description = "Description"
+    actions = ["export_activity_csv"]
+
+    def export_activity_csv(self, request, queryset):
+        """Stream selected records as CSV without loading them all."""
+        writer = csv.writer(Echo())
+        labels = dict(ActivityLog.ActivityType.choices)
+        rows = (
+            (created_at, labels[activity_type], *rest)
+            for created_at, activity_type, *rest in queryset.values_list(
+                "created_at",
+                "activity_type",
+                "task__name",
+                "user__username",
+                "description",
+            ).iterator(chunk_size=2000)
+        )
+        header = ["Created At", "Activity Type", "Task", "User", "Description"]
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in chain([header], rows)),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = (
+            'attachment; filename="activity_log.csv"'
+        )
+        return response
+
+    export_activity_csv.short_description = "Export to CSV"
 
     def has_add_permission(self, request):
         """Prohibit manual addition of records."""
@@ -182,7 +311,9 @@ class ActivityLogAdmin(admin.ModelAdmin):
 
 
 @admin.register(Notification)
-class NotificationAdmin(admin.ModelAdmin):
+class NotificationAdmin(ListSelectRelatedAdminMixin,
+                        SearchVectorAdminMixin,
+                        admin.ModelAdmin):
     """Notification administration."""
 
     list_display = ["recipient",
@@ -190,7 +321,9 @@ class NotificationAdmin(admin.ModelAdmin):
                     "title", "is_read",
                     "created_at"]
     list_filter = ["notification_type", "is_read", "created_at"]
+    list_select_related = ["recipient__position"]
     search_fields = ["title", "message", "recipient__username"]
+    autocomplete_fields = ["recipient", "task"]
     date_hierarchy = "created_at"
     readonly_fields = ["created_at"]
 
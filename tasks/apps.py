@@ -6,4 +6,4 @@ class TasksConfig(AppConfig):
     name = "tasks"
 
     def ready(self):
-        import tasks.signals  # noqa: F401
+        from . import signals  # noqa: F401
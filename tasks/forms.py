@@ -1,6 +1,8 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
-from .models import Task, Worker, Project, Team, Tag, Comment
+from .models import (
+    Task, Worker, Project, Team, Tag, Comment, validate_deadline
+)
 
 
 class WorkerRegistrationForm(UserCreationForm):
@@ -45,6 +47,12 @@ class TaskForm(forms.ModelForm):
             "tags": forms.CheckboxSelectMultiple(),
         }
 
+    def clean_deadline(self):
+        """Reject deadlines in the past."""
+        deadline = self.cleaned_data["deadline"]
+        validate_deadline(deadline)
+        return deadline
+
 
 class ProjectForm(forms.ModelForm):
     """Form for creating/editing a project."""
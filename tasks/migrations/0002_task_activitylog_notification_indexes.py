@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["task", "-created_at"], name="tasks_activ_task_id_ed12e0_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "is_read", "-created_at"],
+                name="tasks_notif_recipie_9b8351_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "-created_at"],
+                name="tasks_task_is_comp_2b457e_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "is_completed"], name="tasks_task_project_a30823_idx"
+            ),
+        ),
+    ]
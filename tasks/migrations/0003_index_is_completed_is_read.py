@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0002_task_activitylog_notification_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="notification",
+            name="is_read",
+            field=models.BooleanField(
+                db_index=True, default=False, verbose_name="Read"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="is_completed",
+            field=models.BooleanField(
+                db_index=True, default=False, verbose_name="Completed"
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_index_is_completed_is_read"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "-created_at"], name="tasks_task_project_782cbf_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["is_completed", "deadline"],
+                name="tasks_task_is_comp_6474e1_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Admin ``search_fields`` become ``ILIKE '%term%'`` lookups, which B-tree
+# indexes cannot serve. Trigram GIN indexes can, but they only exist on
+# PostgreSQL, so they are created here rather than in ``Meta.indexes``.
+TRIGRAM_INDEXES = [
+    ("tasks_task_name_trgm", "tasks_task", "name"),
+    ("tasks_task_description_trgm", "tasks_task", "description"),
+    ("tasks_comment_content_trgm", "tasks_comment", "content"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} "
+            f"ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0004_task_ordering_deadline_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:06
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The vectors are kept fresh by PostgreSQL triggers rather than Python
+# signals, so bulk_create() and QuerySet.update() paths stay covered.
+SEARCH_VECTOR_COLUMNS = {
+    "tasks_task": ("name", "description"),
+    "tasks_comment": ("content",),
+    "tasks_notification": ("title", "message"),
+}
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, columns in SEARCH_VECTOR_COLUMNS.items():
+        column_list = ", ".join(columns)
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_search_vector_gin "
+            f"ON {table} USING gin (search_vector)"
+        )
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_vector_update "
+            f"BEFORE INSERT OR UPDATE OF {column_list} ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger("
+            f"search_vector, 'pg_catalog.simple', {column_list})"
+        )
+        schema_editor.execute(
+            f"UPDATE {table} SET search_vector = "
+            f"to_tsvector('pg_catalog.simple', {document})"
+        )
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table in SEARCH_VECTOR_COLUMNS:
+        schema_editor.execute(
+            f"DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table}"
+        )
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_vector_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Search Vector"
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Search Vector"
+            ),
+        ),
+        migrations.AddField(
+            model_name="task",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="Search Vector"
+            ),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
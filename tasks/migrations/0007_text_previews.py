@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:08
+
+import django.db.models.functions.text
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_search_vectors"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="activitylog",
+            name="description_preview",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        django.db.models.lookups.GreaterThan(
+                            django.db.models.functions.text.Length("description"), 50
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            django.db.models.functions.text.Substr(
+                                "description", 1, 50
+                            ),
+                            models.Value("..."),
+                        ),
+                    ),
+                    default=models.F("description"),
+                    output_field=models.TextField(),
+                ),
+                output_field=models.CharField(max_length=53),
+                verbose_name="Description",
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="content_preview",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(
+                        django.db.models.lookups.GreaterThan(
+                            django.db.models.functions.text.Length("content"), 50
+                        ),
+                        then=django.db.models.functions.text.Concat(
+                            django.db.models.functions.text.Substr("content", 1, 50),
+                            models.Value("..."),
+                        ),
+                    ),
+                    default=models.F("content"),
+                    output_field=models.TextField(),
+                ),
+                output_field=models.CharField(max_length=53),
+                verbose_name="Content",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_text_previews"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["task", "-created_at"], name="tasks_comme_task_id_a71f0d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["-created_at"], name="tasks_task_created_5da2cb_idx"
+            ),
+        ),
+    ]
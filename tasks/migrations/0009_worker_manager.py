@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:10
+
+import tasks.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_task_comment_created_at_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="worker",
+            managers=[
+                ("objects", tasks.models.WorkerManager()),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0009_worker_manager"),
+    ]
+
+    # The admin cannot edit an M2M field with a custom through model in
+    # its fieldsets, so the index is added to the auto-created table
+    # directly. It lets worker.assigned_tasks lookups read (worker, task)
+    # pairs straight from the index.
+    operations = [
+        migrations.RunSQL(
+            "CREATE INDEX tasks_task_assignees_worker_task_idx "
+            "ON tasks_task_assignees (worker_id, task_id)",
+            "DROP INDEX tasks_task_assignees_worker_task_idx",
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0010_task_assignees_worker_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="task",
+            name="deadline",
+            field=models.DateField(verbose_name="Deadline"),
+        ),
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations
+
+# Stored labels and the small integer codes that replace them. The codes
+# are written as strings first so the following AlterField can cast the
+# column in place.
+ACTIVITY_TYPE_CODES = {
+    "created": 1,
+    "updated": 2,
+    "completed": 3,
+    "reopened": 4,
+    "assigned": 5,
+    "unassigned": 6,
+    "commented": 7,
+    "deleted": 8,
+}
+NOTIFICATION_TYPE_CODES = {
+    "task_assigned": 1,
+    "task_completed": 2,
+    "task_commented": 3,
+    "deadline_approaching": 4,
+    "task_updated": 5,
+}
+FIELDS = [
+    ("ActivityLog", "activity_type", ACTIVITY_TYPE_CODES),
+    ("Notification", "notification_type", NOTIFICATION_TYPE_CODES),
+]
+
+
+def labels_to_codes(apps, schema_editor):
+    for model_name, field, codes in FIELDS:
+        model = apps.get_model("tasks", model_name)
+        for label, code in codes.items():
+            model.objects.filter(**{field: label}).update(**{field: str(code)})
+
+
+def codes_to_labels(apps, schema_editor):
+    for model_name, field, codes in FIELDS:
+        model = apps.get_model("tasks", model_name)
+        for label, code in codes.items():
+            model.objects.filter(**{field: str(code)}).update(**{field: label})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0011_task_deadline_form_validation"),
+    ]
+
+    operations = [
+        migrations.RunPython(labels_to_codes, codes_to_labels),
+    ]
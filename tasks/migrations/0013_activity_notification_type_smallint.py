@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0012_activity_notification_type_codes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="activitylog",
+            name="activity_type",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "Created"),
+                    (2, "Updated"),
+                    (3, "Completed"),
+                    (4, "Reopened"),
+                    (5, "Assigned"),
+                    (6, "Unassigned"),
+                    (7, "Commented"),
+                    (8, "Deleted"),
+                ],
+                verbose_name="Activity Type",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="notification_type",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "Task Assigned"),
+                    (2, "Task Completed"),
+                    (3, "New Comment"),
+                    (4, "Deadline Approaching"),
+                    (5, "Task Updated"),
+                ],
+                verbose_name="Notification Type",
+            ),
+        ),
+    ]
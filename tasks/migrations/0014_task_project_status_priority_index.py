@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-14 17:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0013_activity_notification_type_smallint"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_task_project_a30823_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "is_completed", "priority"],
+                name="tasks_task_project_95ce19_idx",
+            ),
+        ),
+    ]
@@ -1,5 +1,11 @@
+import re
+
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.contrib.postgres.search import SearchQuery, SearchVectorField
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -11,6 +17,41 @@ def validate_deadline(value):
         raise ValidationError("Deadline cannot be in the past")
 
 
+def text_preview(field_name, length=50):
+    """Return an expression with the first characters of a text field."""
+    return Case(
+        When(
+            GreaterThan(Length(field_name), length),
+            then=Concat(Substr(field_name, 1, length), Value("...")),
+        ),
+        default=F(field_name),
+        output_field=models.TextField(),
+    )
+
+
+# Characters kept in prefix search words: enough for names, usernames and
+# email addresses, and nothing tsquery syntax gives a meaning to
+SEARCH_WORD_RE = re.compile(r"[\w@.+-]*\w[\w@.+-]*")
+
+
+def prefix_search_query(text):
+    """Return a query matching each word of ``text`` as a prefix.
+
+    Search vectors use the ``simple`` config, which keeps whole tokens
+    (an email address is one token), so every word becomes a ``:*``
+    prefix lexeme and all of them must match. Returns ``None`` when
+    ``text`` has no word characters.
+    """
+    words = SEARCH_WORD_RE.findall(text)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"'{word}':*" for word in words),
+        config="simple",
+        search_type="raw",
+    )
+
+
 class Position(models.Model):
     """Employee position."""
 
@@ -26,6 +67,23 @@ class Position(models.Model):
         return self.name
 
 
+class WorkerManager(UserManager):
+    """Manager for workers."""
+
+    def with_task_stats(self):
+        """Return workers annotated with completed/incomplete task counts."""
+        return self.get_queryset().annotate(
+            completed_count=Count(
+                "assigned_tasks",
+                filter=Q(assigned_tasks__is_completed=True),
+            ),
+            incomplete_count=Count(
+                "assigned_tasks",
+                filter=Q(assigned_tasks__is_completed=False),
+            ),
+        )
+
+
 class Worker(AbstractUser):
     """Worker (extended user model)."""
 
@@ -41,6 +99,11 @@ class Worker(AbstractUser):
     )
     first_name = models.CharField(max_length=150, verbose_name="First Name")
     last_name = models.CharField(max_length=150, verbose_name="Last Name")
+    search_vector = SearchVectorField(null=True,
+                                      editable=False,
+                                      verbose_name="Search Vector")
+
+    objects = WorkerManager()
 
     class Meta:
         verbose_name = "Worker"
@@ -51,15 +114,62 @@ class Worker(AbstractUser):
 
     def get_completed_tasks(self):
         """Return completed tasks for the worker."""
-        return self.assigned_tasks.filter(is_completed=True)
+        return (
+            self.assigned_tasks.filter(is_completed=True)
+            .select_related("task_type")
+            .prefetch_related("tags")
+        )
 
     def get_incomplete_tasks(self):
         """Return incomplete tasks for the worker."""
-        return self.assigned_tasks.filter(is_completed=False)
+        return (
+            self.assigned_tasks.filter(is_completed=False)
+            .select_related("task_type")
+            .prefetch_related("tags")
+        )
+
+    def get_completed_tasks_count(self):
+        """Return the number of completed tasks.
+
+        Uses the ``completed_count`` annotation from
+        ``Worker.objects.with_task_stats()`` when present.
+        """
+        if hasattr(self, "completed_count"):
+            return self.completed_count
+        return self.get_completed_tasks().count()
+
+    def get_incomplete_tasks_count(self):
+        """Return the number of incomplete tasks.
+
+        Uses the ``incomplete_count`` annotation from
+        ``Worker.objects.with_task_stats()`` when present.
+        """
+        if hasattr(self, "incomplete_count"):
+            return self.incomplete_count
+        return self.get_incomplete_tasks().count()
 
     def get_unread_notifications_count(self):
-        """Return count of unread notifications."""
-        return self.notifications.filter(is_read=False).count()
+        """Return count of unread notifications.
+
+        The count is queried once and cached on the instance, so repeated
+        template lookups share one query.
+        """
+        if not hasattr(self, "unread_count"):
+            self.unread_count = self.notifications.filter(
+                is_read=False
+            ).count()
+        return self.unread_count
+
+    def has_unread_notifications(self):
+        """Return whether the worker has any unread notification.
+
+        Prefer this over ``get_unread_notifications_count() > 0`` where
+        only the yes/no answer is needed; an already loaded count is
+        reused, otherwise the query stops at the first unread row.
+        """
+        if hasattr(self, "unread_count"):
+            return self.unread_count > 0
+        return self.notifications.filter(is_read=False).exists()
 
     def get_unread_notifications(self):
         """Return unread notifications."""
@@ -145,12 +255,14 @@ class Task(models.Model):
         ("Medium", "Medium"),
         ("Low", "Low"),
     ]
+    PRIORITY_DISPLAY = dict(PRIORITY_CHOICES)
 
     name = models.CharField(max_length=200, verbose_name="Task Name")
     description = models.TextField(verbose_name="Description")
-    deadline = models.DateField(verbose_name="Deadline",
-                                validators=[validate_deadline])
-    is_completed = models.BooleanField(default=False, verbose_name="Completed")
+    deadline = models.DateField(verbose_name="Deadline")
+    is_completed = models.BooleanField(default=False,
+                                       db_index=True,
+                                       verbose_name="Completed")
     priority = models.CharField(
         max_length=20,
         choices=PRIORITY_CHOICES,
@@ -189,38 +301,78 @@ class Task(models.Model):
                                       verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True,
                                       verbose_name="Updated At")
+    search_vector = SearchVectorField(null=True,
+                                      editable=False,
+                                      verbose_name="Search Vector")
 
     class Meta:
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["is_completed", "-created_at"]),
+            models.Index(fields=["project", "is_completed", "priority"]),
+            models.Index(fields=["project", "-created_at"]),
+            models.Index(fields=["is_completed", "deadline"]),
+            models.Index(fields=["-created_at"]),
+        ]
 
     def __str__(self):
-        return f"{self.name} ({self.get_priority_display()})"
-
-    def mark_as_completed(self):
-        """Mark task as completed."""
+        priority = self.PRIORITY_DISPLAY.get(self.priority, self.priority)
+        return f"{self.name} ({priority})"
+
+    def mark_as_completed(self, user=None):
+        """Mark task as completed and log who completed it.
+
+        Uses a queryset update so ``post_save`` handlers are not
+        dispatched; the activity log entry is created here instead.
+        """
+        self.updated_at = timezone.now()
+        Task.objects.filter(pk=self.pk).update(
+            is_completed=True, updated_at=self.updated_at
+        )
         self.is_completed = True
-        self.save()
+        ActivityLog.objects.create(
+            task=self,
+            user=user,
+            activity_type=ActivityLog.ActivityType.COMPLETED,
+            description=f'Task "{self.name}" completed',
+        )
 
     def mark_as_incomplete(self):
         """Mark task as incomplete."""
+        self.updated_at = timezone.now()
+        Task.objects.filter(pk=self.pk).update(
+            is_completed=False, updated_at=self.updated_at
+        )
         self.is_completed = False
-        self.save()
 
     def get_activity_log(self):
-        """Return all activity for the task."""
-        return self.activity_logs.all().order_by("-created_at")
+        """Return all activity for the task, newest first.
+
+        Ordering comes from ``Meta.ordering``, so a prefetch of
+        ``activity_logs`` is reused. The queryset is lazy; iterate it (or
+        use ``iterator()``) rather than wrapping it in ``list()`` for long
+        histories.
+        """
+        return self.activity_logs.all()
 
     def get_comments(self):
-        """Return all comments for the task."""
-        return self.comments.all().order_by("-created_at")
+        """Return all comments for the task, newest first."""
+        return self.comments.all()
 
     def get_completion_percentage(self):
         """Return completion percentage (0 or 100)."""
         return 100 if self.is_completed else 0
 
 
+class CommentManager(models.Manager):
+    """Manager for comments; joins the author and task."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("author", "task")
+
+
 class Comment(models.Model):
     """Comment on a task."""
 
@@ -235,33 +387,53 @@ class Comment(models.Model):
         verbose_name="Author"
     )
     content = models.TextField(verbose_name="Comment Content")
+    content_preview = models.GeneratedField(
+        expression=text_preview("content"),
+        output_field=models.CharField(max_length=53),
+        db_persist=True,
+        verbose_name="Content",
+    )
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name="Created At")
     updated_at = models.DateTimeField(auto_now=True,
                                       verbose_name="Updated At")
+    search_vector = SearchVectorField(null=True,
+                                      editable=False,
+                                      verbose_name="Search Vector")
+
+    objects = CommentManager()
 
     class Meta:
         verbose_name = "Comment"
         verbose_name_plural = "Comments"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["task", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"Comment by {self.author} on {self.task.name}"
 
 
+class ActivityLogManager(models.Manager):
+    """Manager for activity logs; joins the task and user."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("task", "user")
+
+
 class ActivityLog(models.Model):
     """Activity log for tracking changes."""
 
-    ACTIVITY_TYPES = [
-        ("created", "Created"),
-        ("updated", "Updated"),
-        ("completed", "Completed"),
-        ("reopened", "Reopened"),
-        ("assigned", "Assigned"),
-        ("unassigned", "Unassigned"),
-        ("commented", "Commented"),
-        ("deleted", "Deleted"),
-    ]
+    class ActivityType(models.IntegerChoices):
+        CREATED = 1, "Created"
+        UPDATED = 2, "Updated"
+        COMPLETED = 3, "Completed"
+        REOPENED = 4, "Reopened"
+        ASSIGNED = 5, "Assigned"
+        UNASSIGNED = 6, "Unassigned"
+        COMMENTED = 7, "Commented"
+        DELETED = 8, "Deleted"
 
     task = models.ForeignKey(
         Task,
@@ -278,32 +450,49 @@ class ActivityLog(models.Model):
         related_name="activities",
         verbose_name="User",
     )
-    activity_type = models.CharField(
-        max_length=20, choices=ACTIVITY_TYPES, verbose_name="Activity Type"
+    activity_type = models.PositiveSmallIntegerField(
+        choices=ActivityType.choices, verbose_name="Activity Type"
     )
     description = models.TextField(verbose_name="Description")
+    description_preview = models.GeneratedField(
+        expression=text_preview("description"),
+        output_field=models.CharField(max_length=53),
+        db_persist=True,
+        verbose_name="Description",
+    )
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name="Created At")
 
+    objects = ActivityLogManager()
+
     class Meta:
         verbose_name = "Activity Log"
         verbose_name_plural = "Activity Logs"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["task", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.get_activity_type_display()} - {self.description}"
 
 
+class NotificationManager(models.Manager):
+    """Manager for notifications; joins the related task."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("task")
+
+
 class Notification(models.Model):
     """Notification for a user."""
 
-    NOTIFICATION_TYPES = [
-        ("task_assigned", "Task Assigned"),
-        ("task_completed", "Task Completed"),
-        ("task_commented", "New Comment"),
-        ("deadline_approaching", "Deadline Approaching"),
-        ("task_updated", "Task Updated"),
-    ]
+    class NotificationType(models.IntegerChoices):
+        TASK_ASSIGNED = 1, "Task Assigned"
+        TASK_COMPLETED = 2, "Task Completed"
+        TASK_COMMENTED = 3, "New Comment"
+        DEADLINE_APPROACHING = 4, "Deadline Approaching"
+        TASK_UPDATED = 5, "Task Updated"
 
     recipient = models.ForeignKey(
         Worker,
@@ -311,9 +500,8 @@ class Notification(models.Model):
         related_name="notifications",
         verbose_name="Recipient",
     )
-    notification_type = models.CharField(
-        max_length=30, choices=NOTIFICATION_TYPES,
-        verbose_name="Notification Type"
+    notification_type = models.PositiveSmallIntegerField(
+        choices=NotificationType.choices, verbose_name="Notification Type"
     )
     title = models.CharField(max_length=200, verbose_name="Title")
     message = models.TextField(verbose_name="Message")
@@ -326,14 +514,23 @@ class Notification(models.Model):
         verbose_name="Task",
     )
     is_read = models.BooleanField(default=False,
+                                  db_index=True,
                                   verbose_name="Read")
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name="Created At")
+    search_vector = SearchVectorField(null=True,
+                                      editable=False,
+                                      verbose_name="Search Vector")
+
+    objects = NotificationManager()
 
     class Meta:
         verbose_name = "Notification"
         verbose_name_plural = "Notifications"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["recipient", "is_read", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.title} for {self.recipient}"
@@ -341,4 +538,22 @@ class Notification(models.Model):
     def mark_as_read(self):
         """Mark notification as read."""
         self.is_read = True
-        self.save()
+        self.save(update_fields=["is_read"])
+
+    @classmethod
+    def fanout(cls, recipient_ids, notification_type, title, message,
+               task=None):
+        """Create the same notification for several recipients at once."""
+        return cls.objects.bulk_create(
+            [
+                cls(
+                    recipient_id=recipient_id,
+                    notification_type=notification_type,
+                    title=title,
+                    message=message,
+                    task_id=task.pk if task is not None else None,
+                )
+                for recipient_id in recipient_ids
+            ],
+            batch_size=500,
+        )
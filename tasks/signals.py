@@ -1,101 +1,127 @@
+from django.db import transaction
 from django.db.models.signals import post_save, m2m_changed
 from django.dispatch import receiver
 from .models import Task, Comment, ActivityLog, Notification
 
+ActivityType = ActivityLog.ActivityType
+NotificationType = Notification.NotificationType
 
-@receiver(post_save, sender=Task)
+
+@receiver(post_save, sender=Task, dispatch_uid="task_post_save")
 def task_post_save(sender, instance, created, **kwargs):
     """Create activity log when a task is created or updated."""
     if created:
         ActivityLog.objects.create(
             task=instance,
             user=instance.created_by,
-            activity_type="created",
+            activity_type=ActivityType.CREATED,
             description=f'Task "{instance.name}" created',
         )
     else:
+        # Saves that leave the status untouched cannot complete the task
+        update_fields = kwargs.get("update_fields")
+        if update_fields and "is_completed" not in update_fields:
+            return
+
         # Check if status changed
         if instance.is_completed:
             ActivityLog.objects.create(
                 task=instance,
                 user=None,  # Will be set in view
-                activity_type="completed",
+                activity_type=ActivityType.COMPLETED,
                 description=f'Task "{instance.name}" completed',
             )
 
 
-@receiver(m2m_changed, sender=Task.assignees.through)
+@receiver(
+    m2m_changed,
+    sender=Task.assignees.through,
+    dispatch_uid="task_assignees_changed",
+)
+@transaction.atomic(savepoint=False)
 def task_assignees_changed(sender, instance, action, pk_set, **kwargs):
     """Create notifications when a task is assigned."""
     if action == "post_add":
         from .models import Worker
 
-        for worker_id in pk_set:
-            worker = Worker.objects.get(pk=worker_id)
-            Notification.objects.create(
-                recipient=worker,
-                notification_type="task_assigned",
-                title="New Task",
-                message=f"You have been assigned a task: {instance.name}",
-                task=instance,
-            )
-            ActivityLog.objects.create(
-                task=instance,
-                user=worker,
-                activity_type="assigned",
-                description=f"{worker.get_full_name()} assigned to task",
-            )
+        workers = Worker.objects.only(
+            "id", "first_name", "last_name"
+        ).in_bulk(pk_set)
+        Notification.fanout(
+            workers.keys(),
+            notification_type=NotificationType.TASK_ASSIGNED,
+            title="New Task",
+            message=f"You have been assigned a task: {instance.name}",
+            task=instance,
+        )
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task_id=instance.pk,
+                    user_id=worker_id,
+                    activity_type=ActivityType.ASSIGNED,
+                    description=f"{worker.get_full_name()} assigned to task",
+                )
+                for worker_id, worker in workers.items()
+            ]
+        )
     elif action == "post_remove":
         from .models import Worker
 
-        for worker_id in pk_set:
-            worker = Worker.objects.get(pk=worker_id)
-            ActivityLog.objects.create(
-                task=instance,
-                user=worker,
-                activity_type="unassigned",
-                description=f"{worker.get_full_name()} removed from task",
-            )
+        workers = Worker.objects.only(
+            "id", "first_name", "last_name"
+        ).in_bulk(pk_set)
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task_id=instance.pk,
+                    user_id=worker_id,
+                    activity_type=ActivityType.UNASSIGNED,
+                    description=f"{worker.get_full_name()} removed from task",
+                )
+                for worker_id, worker in workers.items()
+            ]
+        )
 
 
-@receiver(post_save, sender=Comment)
+@receiver(post_save, sender=Comment, dispatch_uid="comment_post_save")
+@transaction.atomic(savepoint=False)
 def comment_post_save(sender, instance, created, **kwargs):
     """Create notifications and activity log when a comment is added."""
     if created:
+        task = instance.task
+        author_name = instance.author.get_full_name()
+        task_name = task.name
+        # Served from the caller's prefetch when there is one
+        assignee_ids = {worker.pk for worker in task.assignees.all()}
+
         # Create activity log
         ActivityLog.objects.create(
-            task=instance.task,
+            task=task,
             user=instance.author,
-            activity_type="commented",
-            description=f"{instance.author.get_full_name()} added a comment",
+            activity_type=ActivityType.COMMENTED,
+            description=f"{author_name} added a comment",
         )
 
         # Create notifications for all assignees (except comment author)
-        for assignee in instance.task.assignees.exclude(id=instance.author.id):
-            Notification.objects.create(
-                recipient=assignee,
-                notification_type="task_commented",
-                title="New Comment",
-                message=(
-                    f"{instance.author.get_full_name()} "
-                    f"commented on task: {instance.task.name}"
-                ),
-                task=instance.task,
-            )
+        Notification.fanout(
+            assignee_ids - {instance.author_id},
+            notification_type=NotificationType.TASK_COMMENTED,
+            title="New Comment",
+            message=f"{author_name} commented on task: {task_name}",
+            task=task,
+        )
 
         # Also notify task creator if they are not the comment author
-        if (instance.task.created_by
-                and instance.task.created_by != instance.author):
-            if not instance.task.assignees.filter(
-                id=instance.task.created_by.id
-            ).exists():
+        if (task.created_by_id
+                and task.created_by_id != instance.author_id):
+            if task.created_by_id not in assignee_ids:
                 Notification.objects.create(
-                    recipient=instance.task.created_by,
-                    notification_type="task_commented",
+                    recipient_id=task.created_by_id,
+                    notification_type=NotificationType.TASK_COMMENTED,
                     title="New Comment",
                     message=(
-                        f"{instance.author.get_full_name()} "
-                        f"commented on your task: {instance.task.name}"
+                        f"{author_name} commented on your task: {task_name}"
                     ),
-                    task=instance.task,
+                    task=task,
                 )
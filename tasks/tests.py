@@ -1,6 +1,17 @@
+from contextlib import contextmanager
+import csv
+import json
+from unittest import skipUnless
 from datetime import timedelta
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.test import TestCase, Client
+from django.contrib.postgres.search import SearchQuery
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count
+from django.db.models.signals import m2m_changed, post_save
+from django.test import SimpleTestCase, TestCase, Client
 from django.urls import reverse
 from django.utils import timezone
 from tasks.models import (
@@ -14,8 +25,10 @@ from tasks.models import (
     Comment,
     ActivityLog,
     Notification,
+    prefix_search_query,
     validate_deadline,
 )
+from tasks.signals import task_assignees_changed, task_post_save
 from tasks.forms import (
     WorkerRegistrationForm,
     TaskForm,
@@ -25,42 +38,189 @@ from tasks.forms import (
     CommentForm,
 )
 
+ActivityType = ActivityLog.ActivityType
+NotificationType = Notification.NotificationType
+TOMORROW = timezone.localdate() + timedelta(days=1)
+
+
+def create_workers(position, *names):
+    """Bulk-create password-less workers from (username, first, last)."""
+    return Worker.objects.bulk_create(
+        [
+            Worker(
+                username=username,
+                email=f"{username}@example.com",
+                first_name=first_name,
+                last_name=last_name,
+                position=position,
+            )
+            for username, first_name, last_name in names
+        ]
+    )
+
+
+@contextmanager
+def disconnect_task_signals():
+    """Disconnect the Task activity/notification handlers in the block."""
+    post_save.disconnect(sender=Task, dispatch_uid="task_post_save")
+    m2m_changed.disconnect(
+        sender=Task.assignees.through,
+        dispatch_uid="task_assignees_changed",
+    )
+    try:
+        yield
+    finally:
+        post_save.connect(
+            task_post_save, sender=Task, dispatch_uid="task_post_save"
+        )
+        m2m_changed.connect(
+            task_assignees_changed,
+            sender=Task.assignees.through,
+            dispatch_uid="task_assignees_changed",
+        )
+
+
+class TaskSignalsDisconnectedMixin:
+    """Disconnect the Task activity/notification handlers for a class.
+
+    For test classes that never assert on the ActivityLog and Notification
+    rows the Task signals produce.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.enterClassContext(disconnect_task_signals())
+        super().setUpClass()
+
+
+class TaskFixtureMixin:
+    """Provide a worker and a task created once per test class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.future_date = TOMORROW
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker = Worker.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            first_name="John",
+            last_name="Doe",
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.task = Task.objects.create(
+            name="Test Task",
+            description="Test",
+            deadline=cls.future_date,
+            task_type=cls.task_type,
+            created_by=cls.worker,
+        )
+
+
+class SuperuserFixtureMixin:
+    """Provide a superuser and a regular worker created once per class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.superuser, cls.regular_user = Worker.objects.bulk_create(
+            [
+                Worker(
+                    username="admin",
+                    email="admin@example.com",
+                    first_name="Admin",
+                    last_name="User",
+                    is_staff=True,
+                    is_superuser=True,
+                ),
+                Worker(
+                    username="regular",
+                    email="regular@example.com",
+                    first_name="Regular",
+                    last_name="User",
+                    position=cls.position,
+                ),
+            ]
+        )
+
+
+class LoggedInClientMixin:
+    """Log the test client in as ``cls.user`` with one session per class.
+
+    The session row is created once, inside the class-wide transaction, and
+    each test only installs its cookie on the fresh client.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        client = Client()
+        client.force_login(cls.user)
+        cls.session_key = client.cookies[settings.SESSION_COOKIE_NAME].value
+
+    def setUp(self):
+        super().setUp()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+
 
 class PositionModelTest(TestCase):
     """Test Position model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
 
     def test_position_creation(self):
         """Test position is created correctly."""
         self.assertEqual(self.position.name, "Developer")
         self.assertIsNotNone(self.position.id)
 
-    def test_position_str(self):
-        """Test position string representation."""
-        self.assertEqual(str(self.position), "Developer")
-
     def test_position_unique_name(self):
         """Test position name must be unique."""
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             Position.objects.create(name="Developer")
 
 
-class WorkerModelTest(TestCase):
+class WorkerModelTest(TaskSignalsDisconnectedMixin, TestCase):
     """Test Worker model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.future_date = TOMORROW
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker = Worker.objects.create_user(
             username="testuser",
             email="test@example.com",
             password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.completed_task, cls.incomplete_task = Task.objects.bulk_create(
+            [
+                Task(
+                    name=name,
+                    description="Test",
+                    deadline=cls.future_date,
+                    is_completed=is_completed,
+                    task_type=cls.task_type,
+                    created_by=cls.worker,
+                )
+                for name, is_completed in (
+                    ("Completed Task", True),
+                    ("Incomplete Task", False),
+                )
+            ]
+        )
+        Assignment = Task.assignees.through
+        Assignment.objects.bulk_create(
+            [
+                Assignment(task=task, worker=cls.worker)
+                for task in (cls.completed_task, cls.incomplete_task)
+            ]
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
 
     def test_worker_creation(self):
         """Test worker is created correctly."""
@@ -70,149 +230,143 @@ class WorkerModelTest(TestCase):
         self.assertEqual(self.worker.last_name, "Doe")
         self.assertEqual(self.worker.position, self.position)
 
-    def test_worker_str(self):
-        """Test worker string representation."""
-        expected = (f"{self.worker.first_name}"
-                    f"{self.worker.last_name}"
-                    f"({self.position})")
-        self.assertEqual(str(self.worker), expected)
-
-    def test_get_completed_tasks(self):
-        """Test get_completed_tasks method."""
-        # Create completed task
-        completed_task = Task.objects.create(
-            name="Completed Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=True,
-            task_type=self.task_type,
-            created_by=self.worker,
+    def test_task_filters(self):
+        """Test get_completed_tasks and get_incomplete_tasks methods."""
+        self.assertEqual(
+            list(self.worker.get_completed_tasks()), [self.completed_task]
         )
-        completed_task.assignees.add(self.worker)
-
-        # Create incomplete task
-        incomplete_task = Task.objects.create(
-            name="Incomplete Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=False,
-            task_type=self.task_type,
-            created_by=self.worker,
+        self.assertEqual(
+            list(self.worker.get_incomplete_tasks()), [self.incomplete_task]
         )
-        incomplete_task.assignees.add(self.worker)
 
-        completed = self.worker.get_completed_tasks()
-        self.assertEqual(completed.count(), 1)
-        self.assertEqual(completed.first(), completed_task)
+    def test_task_filters_load_related(self):
+        """Test task getters load the task type and tags up front."""
+        with self.assertNumQueries(2):
+            for task in self.worker.get_completed_tasks():
+                self.assertEqual(task.task_type, self.task_type)
+                self.assertEqual(list(task.tags.all()), [])
 
-    def test_get_incomplete_tasks(self):
-        """Test get_incomplete_tasks method."""
-        # Create tasks
-        completed_task = Task.objects.create(
-            name="Completed Task",
+    def test_with_task_stats(self):
+        """Test with_task_stats annotates task counts."""
+        task = Task.objects.create(
+            name="Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             is_completed=True,
             task_type=self.task_type,
             created_by=self.worker,
         )
-        completed_task.assignees.add(self.worker)
+        task.assignees.add(self.worker)
 
-        incomplete_task = Task.objects.create(
-            name="Incomplete Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=False,
-            task_type=self.task_type,
-            created_by=self.worker,
-        )
-        incomplete_task.assignees.add(self.worker)
+        self.assertEqual(self.worker.get_completed_tasks_count(), 2)
+        self.assertEqual(self.worker.get_incomplete_tasks_count(), 1)
 
-        incomplete = self.worker.get_incomplete_tasks()
-        self.assertEqual(incomplete.count(), 1)
-        self.assertEqual(incomplete.first(), incomplete_task)
+        worker = Worker.objects.with_task_stats().get(pk=self.worker.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(worker.get_completed_tasks_count(), 2)
+            self.assertEqual(worker.get_incomplete_tasks_count(), 1)
 
     def test_get_unread_notifications_count(self):
         """Test get_unread_notifications_count method."""
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
 
-        # Create unread notifications
-        Notification.objects.create(
-            recipient=self.worker,
-            notification_type="task_assigned",
-            title="Test Notification 1",
-            message="Test message",
-            task=task,
-            is_read=False,
-        )
-        Notification.objects.create(
-            recipient=self.worker,
-            notification_type="task_assigned",
-            title="Test Notification 2",
-            message="Test message",
-            task=task,
-            is_read=False,
+        # Two unread notifications and one read notification
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=self.worker,
+                    notification_type=NotificationType.TASK_ASSIGNED,
+                    title=f"Test Notification {i}",
+                    message="Test message",
+                    task=task,
+                    is_read=(i == 3),
+                )
+                for i in (1, 2, 3)
+            ]
         )
 
-        # Create read notification
+        self.assertEqual(self.worker.get_unread_notifications_count(), 2)
+
+        # Repeated calls reuse the cached count
+        with self.assertNumQueries(0):
+            self.assertEqual(self.worker.get_unread_notifications_count(), 2)
+
+    def test_has_unread_notifications(self):
+        """Test has_unread_notifications method."""
+        self.assertFalse(self.worker.has_unread_notifications())
         Notification.objects.create(
             recipient=self.worker,
-            notification_type="task_assigned",
-            title="Test Notification 3",
+            notification_type=NotificationType.TASK_ASSIGNED,
+            title="Test Notification",
             message="Test message",
-            task=task,
-            is_read=True,
         )
+        self.assertTrue(self.worker.has_unread_notifications())
 
-        self.assertEqual(self.worker.get_unread_notifications_count(), 2)
+        # An already loaded count is reused
+        self.worker.get_unread_notifications_count()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.worker.has_unread_notifications())
 
     def test_get_unread_notifications(self):
         """Test get_unread_notifications method."""
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
 
-        Notification.objects.create(
-            recipient=self.worker,
-            notification_type="task_assigned",
-            title="Read",
-            message="Test",
-            task=task,
-            is_read=True,
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=self.worker,
+                    notification_type=NotificationType.TASK_ASSIGNED,
+                    title=title,
+                    message="Test",
+                    task=task,
+                    is_read=is_read,
+                )
+                for title, is_read in (
+                    ("Unread 1", False),
+                    ("Unread 2", False),
+                    ("Read", True),
+                )
+            ]
         )
 
         unread = self.worker.get_unread_notifications()
-        self.assertEqual(unread.count(), 2)
-        # Should be ordered by -created_at (most recent first)
-        # Since unread2 was created last, it should be first
-        self.assertIn(unread.first().title, ["Unread 1", "Unread 2"])
+        self.assertQuerySetEqual(
+            unread.values_list("title", flat=True),
+            ["Unread 1", "Unread 2"],
+            ordered=False,
+        )
 
 
 class TaskModelTest(TestCase):
     """Test Task model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.future_date = TOMORROW
+        cls.past_date = timezone.now().date() - timedelta(days=1)
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker = Worker.objects.create_user(
             username="testuser",
             email="test@example.com",
             password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.project = Project.objects.create(
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.project = Project.objects.create(
             name="Test Project", description="Test description"
         )
 
@@ -221,7 +375,7 @@ class TaskModelTest(TestCase):
         task = Task.objects.create(
             name="Test Task",
             description="Test description",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             priority="High",
             task_type=self.task_type,
             project=self.project,
@@ -231,39 +385,25 @@ class TaskModelTest(TestCase):
         self.assertEqual(task.priority, "High")
         self.assertFalse(task.is_completed)
 
-    def test_task_str(self):
-        """Test task string representation."""
-        task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            priority="High",
-            task_type=self.task_type,
-            created_by=self.worker,
-        )
-        self.assertEqual(str(task), "Test Task (High)")
-
     def test_validate_deadline_future(self):
         """Test deadline validation accepts future dates."""
-        future_date = timezone.now().date() + timedelta(days=1)
         try:
-            validate_deadline(future_date)
+            validate_deadline(self.future_date)
         except ValidationError:
             self.fail("validate_deadline raised"
                       "ValidationError for future date")
 
     def test_validate_deadline_past(self):
         """Test deadline validation rejects past dates."""
-        past_date = timezone.now().date() - timedelta(days=1)
         with self.assertRaises(ValidationError):
-            validate_deadline(past_date)
+            validate_deadline(self.past_date)
 
     def test_mark_as_completed(self):
         """Test mark_as_completed method."""
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
@@ -271,12 +411,30 @@ class TaskModelTest(TestCase):
         task.mark_as_completed()
         self.assertTrue(task.is_completed)
 
+    def test_mark_as_completed_logs_once(self):
+        """Test mark_as_completed logs a single completion with the user."""
+        task = Task.objects.create(
+            name="Test Task",
+            description="Test",
+            deadline=self.future_date,
+            task_type=self.task_type,
+            created_by=self.worker,
+        )
+        task.mark_as_completed(user=self.worker)
+        task.refresh_from_db()
+        self.assertTrue(task.is_completed)
+        logs = ActivityLog.objects.filter(
+            task=task, activity_type=ActivityType.COMPLETED
+        )
+        self.assertEqual(logs.count(), 1)
+        self.assertEqual(logs.get().user, self.worker)
+
     def test_mark_as_incomplete(self):
         """Test mark_as_incomplete method."""
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             is_completed=True,
             task_type=self.task_type,
             created_by=self.worker,
@@ -285,12 +443,25 @@ class TaskModelTest(TestCase):
         task.mark_as_incomplete()
         self.assertFalse(task.is_completed)
 
+    def test_get_comments_uses_prefetch(self):
+        """Test get_comments is served from a comments prefetch."""
+        Task.objects.create(
+            name="Test Task",
+            description="Test",
+            deadline=self.future_date,
+            task_type=self.task_type,
+            created_by=self.worker,
+        )
+        task = Task.objects.prefetch_related("comments").get()
+        with self.assertNumQueries(0):
+            self.assertEqual(list(task.get_comments()), [])
+
     def test_get_completion_percentage(self):
         """Test get_completion_percentage method."""
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
@@ -304,7 +475,7 @@ class TaskModelTest(TestCase):
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
@@ -313,7 +484,7 @@ class TaskModelTest(TestCase):
         ActivityLog.objects.create(
             task=task,
             user=self.worker,
-            activity_type="updated",
+            activity_type=ActivityType.UPDATED,
             description="Task updated",
         )
 
@@ -326,7 +497,7 @@ class TaskModelTest(TestCase):
         task = Task.objects.create(
             name="Test Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=self.future_date,
             task_type=self.task_type,
             created_by=self.worker,
         )
@@ -342,28 +513,9 @@ class TaskModelTest(TestCase):
         self.assertEqual(comments.count(), 2)
 
 
-class CommentModelTest(TestCase):
+class CommentModelTest(TaskFixtureMixin, TestCase):
     """Test Comment model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.worker,
-        )
-
     def test_comment_creation(self):
         """Test comment is created correctly."""
         comment = Comment.objects.create(
@@ -373,108 +525,66 @@ class CommentModelTest(TestCase):
         self.assertEqual(comment.task, self.task)
         self.assertEqual(comment.author, self.worker)
 
-    def test_comment_str(self):
-        """Test comment string representation."""
-        comment = Comment.objects.create(
-            task=self.task, author=self.worker, content="Test comment"
+    def test_comment_content_preview(self):
+        """Test content_preview is truncated to 50 characters."""
+        short = Comment.objects.create(
+            task=self.task, author=self.worker, content="Short comment"
+        )
+        long = Comment.objects.create(
+            task=self.task, author=self.worker, content="x" * 60
         )
-        expected = f"Comment by {self.worker} on {self.task.name}"
-        self.assertEqual(str(comment), expected)
+        short.refresh_from_db()
+        long.refresh_from_db()
+        self.assertEqual(short.content_preview, "Short comment")
+        self.assertEqual(long.content_preview, "x" * 50 + "...")
 
 
-class ActivityLogModelTest(TestCase):
+class ActivityLogModelTest(TaskFixtureMixin, TestCase):
     """Test ActivityLog model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.worker,
-        )
-
     def test_activity_log_creation(self):
         """Test activity log is created correctly."""
         log = ActivityLog.objects.create(
             task=self.task,
             user=self.worker,
-            activity_type="created",
+            activity_type=ActivityType.CREATED,
             description="Task created",
         )
         self.assertEqual(log.task, self.task)
         self.assertEqual(log.user, self.worker)
-        self.assertEqual(log.activity_type, "created")
+        self.assertEqual(log.activity_type, ActivityType.CREATED)
 
-    def test_activity_log_str(self):
-        """Test activity log string representation."""
-        log = ActivityLog.objects.create(
-            task=self.task,
-            user=self.worker,
-            activity_type="created",
-            description="Task created",
-        )
-        self.assertEqual(str(log), "Created - Task created")
+    def test_activity_log_joins_user(self):
+        """Test activity users are loaded with the log entries."""
+        with self.assertNumQueries(1):
+            users = [log.user for log in self.task.get_activity_log()]
+        self.assertEqual(users, [self.worker])
 
     def test_activity_types(self):
         """Test all activity types are valid."""
-        valid_types = [
-            "created",
-            "updated",
-            "completed",
-            "reopened",
-            "assigned",
-            "unassigned",
-            "commented",
-            "deleted",
-        ]
-        for activity_type in valid_types:
-            log = ActivityLog.objects.create(
-                task=self.task,
-                user=self.worker,
-                activity_type=activity_type,
-                description=f"Test {activity_type}",
-            )
+        logs = ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task=self.task,
+                    user=self.worker,
+                    activity_type=activity_type,
+                    description=f"Test {activity_type.label}",
+                )
+                for activity_type in ActivityType
+            ]
+        )
+        for log, activity_type in zip(logs, ActivityType):
             self.assertEqual(log.activity_type, activity_type)
 
 
-class NotificationModelTest(TestCase):
+class NotificationModelTest(TaskFixtureMixin, TestCase):
     """Test Notification model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.worker,
-        )
-
     def test_notification_creation(self):
         """Test notification is created correctly."""
         notification = Notification.objects.create(
             recipient=self.worker,
-            notification_type="task_assigned",
+            notification_type=NotificationType.TASK_ASSIGNED,
             title="New Task",
             message="You have been assigned a task",
             task=self.task,
@@ -482,23 +592,11 @@ class NotificationModelTest(TestCase):
         self.assertEqual(notification.recipient, self.worker)
         self.assertFalse(notification.is_read)
 
-    def test_notification_str(self):
-        """Test notification string representation."""
-        notification = Notification.objects.create(
-            recipient=self.worker,
-            notification_type="task_assigned",
-            title="New Task",
-            message="Test message",
-            task=self.task,
-        )
-        expected = f"New Task for {self.worker}"
-        self.assertEqual(str(notification), expected)
-
     def test_mark_as_read(self):
         """Test mark_as_read method."""
         notification = Notification.objects.create(
             recipient=self.worker,
-            notification_type="task_assigned",
+            notification_type=NotificationType.TASK_ASSIGNED,
             title="New Task",
             message="Test message",
             task=self.task,
@@ -509,23 +607,48 @@ class NotificationModelTest(TestCase):
 
     def test_notification_types(self):
         """Test all notification types are valid."""
-        valid_types = [
-            "task_assigned",
-            "task_completed",
-            "task_commented",
-            "deadline_approaching",
-            "task_updated",
-        ]
-        for notif_type in valid_types:
-            notification = Notification.objects.create(
-                recipient=self.worker,
-                notification_type=notif_type,
-                title="Test",
-                message="Test message",
-                task=self.task,
-            )
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=self.worker,
+                    notification_type=notif_type,
+                    title="Test",
+                    message="Test message",
+                    task=self.task,
+                )
+                for notif_type in NotificationType
+            ]
+        )
+        for notification, notif_type in zip(notifications, NotificationType):
             self.assertEqual(notification.notification_type, notif_type)
 
+    def test_fanout(self):
+        """Test fanout creates one notification per recipient."""
+        other = Worker.objects.create_user(
+            username="otheruser",
+            email="other@example.com",
+            password="testpass123",
+            first_name="Jane",
+            last_name="Smith",
+            position=self.position,
+        )
+        notifications = Notification.fanout(
+            [self.worker.pk, other.pk],
+            notification_type=NotificationType.TASK_UPDATED,
+            title="Updated",
+            message="Test message",
+            task=self.task,
+        )
+        self.assertEqual(len(notifications), 2)
+        self.assertEqual(
+            set(
+                Notification.objects.filter(
+                    notification_type=NotificationType.TASK_UPDATED
+                ).values_list("recipient", flat=True)
+            ),
+            {self.worker.pk, other.pk},
+        )
+
 
 class ProjectModelTest(TestCase):
     """Test Project model."""
@@ -538,34 +661,19 @@ class ProjectModelTest(TestCase):
         self.assertEqual(project.name, "Test Project")
         self.assertEqual(project.description, "Test description")
 
-    def test_project_str(self):
-        """Test project string representation."""
-        project = Project.objects.create(name="Test Project")
-        self.assertEqual(str(project), "Test Project")
-
 
 class TeamModelTest(TestCase):
     """Test Team model."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker1 = Worker.objects.create_user(
-            username="user1",
-            email="user1@example.com",
-            password="pass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.worker2 = Worker.objects.create_user(
-            username="user2",
-            email="user2@example.com",
-            password="pass123",
-            first_name="Jane",
-            last_name="Smith",
-            position=self.position,
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker1, cls.worker2 = create_workers(
+            cls.position,
+            ("user1", "John", "Doe"),
+            ("user2", "Jane", "Smith"),
         )
-        self.project = Project.objects.create(name="Test Project")
+        cls.project = Project.objects.create(name="Test Project")
 
     def test_team_creation(self):
         """Test team is created correctly."""
@@ -574,11 +682,6 @@ class TeamModelTest(TestCase):
         self.assertEqual(team.name, "Test Team")
         self.assertEqual(team.members.count(), 2)
 
-    def test_team_str(self):
-        """Test team string representation."""
-        team = Team.objects.create(name="Test Team")
-        self.assertEqual(str(team), "Test Team")
-
 
 class TagModelTest(TestCase):
     """Test Tag model."""
@@ -588,15 +691,10 @@ class TagModelTest(TestCase):
         tag = Tag.objects.create(name="urgent")
         self.assertEqual(tag.name, "urgent")
 
-    def test_tag_str(self):
-        """Test tag string representation."""
-        tag = Tag.objects.create(name="urgent")
-        self.assertEqual(str(tag), "urgent")
-
     def test_tag_unique_name(self):
         """Test tag name must be unique."""
         Tag.objects.create(name="urgent")
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             Tag.objects.create(name="urgent")
 
 
@@ -608,23 +706,88 @@ class TaskTypeModelTest(TestCase):
         task_type = TaskType.objects.create(name="Bug Fix")
         self.assertEqual(task_type.name, "Bug Fix")
 
-    def test_task_type_str(self):
-        """Test task type string representation."""
-        task_type = TaskType.objects.create(name="Bug Fix")
-        self.assertEqual(str(task_type), "Bug Fix")
-
     def test_task_type_unique_name(self):
         """Test task type name must be unique."""
         TaskType.objects.create(name="Bug Fix")
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             TaskType.objects.create(name="Bug Fix")
 
 
+class PrefixSearchQueryTest(SimpleTestCase):
+    """Test prefix_search_query builds a prefix tsquery."""
+
+    def test_words_become_prefix_lexemes(self):
+        """Test each word is a quoted prefix lexeme and all must match."""
+        self.assertEqual(
+            prefix_search_query("joh jane@example.com"),
+            SearchQuery(
+                "'joh':* & 'jane@example.com':*",
+                config="simple",
+                search_type="raw",
+            ),
+        )
+
+    def test_tsquery_syntax_is_dropped(self):
+        """Test characters with a meaning in tsquery are dropped."""
+        self.assertEqual(
+            prefix_search_query("joh' | !doe:*"),
+            SearchQuery("'joh':* & 'doe':*", config="simple",
+                        search_type="raw"),
+        )
+        self.assertIsNone(prefix_search_query("' & !"))
+
+
+class StrRepresentationTest(TaskFixtureMixin, TestCase):
+    """Test string representations of all models."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.comment = Comment.objects.create(
+            task=cls.task, author=cls.worker, content="Test comment"
+        )
+        cls.activity_log = ActivityLog.objects.create(
+            task=cls.task,
+            user=cls.worker,
+            activity_type=ActivityType.CREATED,
+            description="Task created",
+        )
+        cls.notification = Notification.objects.create(
+            recipient=cls.worker,
+            notification_type=NotificationType.TASK_ASSIGNED,
+            title="New Task",
+            message="Test message",
+            task=cls.task,
+        )
+        cls.project = Project.objects.create(name="Test Project")
+        cls.team = Team.objects.create(name="Test Team")
+        cls.tag = Tag.objects.create(name="urgent")
+
+    def test_str(self):
+        """Test each model's __str__ output."""
+        cases = [
+            (self.position, "Developer"),
+            (self.worker, "John Doe (Developer)"),
+            (self.task, "Test Task (Medium)"),
+            (self.comment, "Comment by John Doe (Developer) on Test Task"),
+            (self.activity_log, "Created - Task created"),
+            (self.notification, "New Task for John Doe (Developer)"),
+            (self.project, "Test Project"),
+            (self.team, "Test Team"),
+            (self.tag, "urgent"),
+            (self.task_type, "Bug Fix"),
+        ]
+        for obj, expected in cases:
+            with self.subTest(model=type(obj).__name__):
+                self.assertEqual(str(obj), expected)
+
+
 class WorkerRegistrationFormTest(TestCase):
     """Test WorkerRegistrationForm."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
 
     def test_valid_form(self):
         """Test form with valid data."""
@@ -709,19 +872,21 @@ class WorkerRegistrationFormTest(TestCase):
 class TaskFormTest(TestCase):
     """Test TaskForm."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.future_date = TOMORROW
+        cls.past_date = timezone.now().date() - timedelta(days=1)
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.project = Project.objects.create(name="Test Project")
-        self.tag = Tag.objects.create(name="urgent")
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.project = Project.objects.create(name="Test Project")
+        cls.tag = Tag.objects.create(name="urgent")
 
     def test_valid_form(self):
         """Test form with valid data."""
@@ -730,8 +895,7 @@ class TaskFormTest(TestCase):
             "description": "Test description",
             "task_type": self.task_type.id,
             "priority": "High",
-            "deadline": (
-                    timezone.now().date() + timedelta(days=1)).isoformat(),
+            "deadline": self.future_date.isoformat(),
             "assignees": [self.worker.id],
             "tags": [self.tag.id],
             "project": self.project.id,
@@ -739,6 +903,19 @@ class TaskFormTest(TestCase):
         form = TaskForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+    def test_past_deadline(self):
+        """Test form rejects a deadline in the past."""
+        form_data = {
+            "name": "Test Task",
+            "description": "Test description",
+            "task_type": self.task_type.id,
+            "priority": "High",
+            "deadline": self.past_date.isoformat(),
+        }
+        form = TaskForm(data=form_data)
+        self.assertFalse(form.is_valid())
+        self.assertIn("deadline", form.errors)
+
     def test_missing_required_fields(self):
         """Test form with missing required fields."""
         form_data = {}
@@ -748,6 +925,10 @@ class TaskFormTest(TestCase):
         self.assertIn("description", form.errors)
         self.assertIn("deadline", form.errors)
 
+
+class TaskFormWidgetTest(SimpleTestCase):
+    """Test TaskForm widgets."""
+
     def test_deadline_widget(self):
         """Test deadline field has date widget."""
         form = TaskForm()
@@ -799,6 +980,10 @@ class ProjectFormTest(TestCase):
         form = ProjectForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+
+class ProjectFormWidgetTest(SimpleTestCase):
+    """Test ProjectForm widgets."""
+
     def test_description_widget(self):
         """Test description field has textarea widget."""
         form = ProjectForm()
@@ -810,25 +995,15 @@ class ProjectFormTest(TestCase):
 class TeamFormTest(TestCase):
     """Test TeamForm."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker1 = Worker.objects.create_user(
-            username="user1",
-            email="user1@example.com",
-            password="pass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker1, cls.worker2 = create_workers(
+            cls.position,
+            ("user1", "John", "Doe"),
+            ("user2", "Jane", "Smith"),
         )
-        self.worker2 = Worker.objects.create_user(
-            username="user2",
-            email="user2@example.com",
-            password="pass123",
-            first_name="Jane",
-            last_name="Smith",
-            position=self.position,
-        )
-        self.project = Project.objects.create(name="Test Project")
+        cls.project = Project.objects.create(name="Test Project")
 
     def test_valid_form(self):
         """Test form with valid data."""
@@ -849,14 +1024,6 @@ class TeamFormTest(TestCase):
         self.assertFalse(form.is_valid())
         self.assertIn("name", form.errors)
 
-    def test_members_widget(self):
-        """Test members field has checkbox select multiple widget."""
-        form = TeamForm()
-        self.assertEqual(
-            form.fields["members"].widget.__class__.__name__,
-            "CheckboxSelectMultiple"
-        )
-
     def test_project_optional(self):
         """Test project is optional."""
         form_data = {
@@ -867,6 +1034,18 @@ class TeamFormTest(TestCase):
         self.assertTrue(form.is_valid())
 
 
+class TeamFormWidgetTest(SimpleTestCase):
+    """Test TeamForm widgets."""
+
+    def test_members_widget(self):
+        """Test members field has checkbox select multiple widget."""
+        form = TeamForm()
+        self.assertEqual(
+            form.fields["members"].widget.__class__.__name__,
+            "CheckboxSelectMultiple"
+        )
+
+
 class TagFormTest(TestCase):
     """Test TagForm."""
 
@@ -878,6 +1057,10 @@ class TagFormTest(TestCase):
         form = TagForm(data=form_data)
         self.assertTrue(form.is_valid())
 
+
+class TagFormNoDatabaseTest(SimpleTestCase):
+    """Test TagForm checks that need no database."""
+
     def test_missing_name(self):
         """Test form with missing name."""
         form_data = {}
@@ -886,7 +1069,7 @@ class TagFormTest(TestCase):
         self.assertIn("name", form.errors)
 
 
-class CommentFormTest(TestCase):
+class CommentFormTest(SimpleTestCase):
     """Test CommentForm."""
 
     def test_valid_form(self):
@@ -925,10 +1108,13 @@ class CommentFormTest(TestCase):
 class RegisterViewTest(TestCase):
     """Test RegisterView."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.url = reverse("register")
+
     def setUp(self):
         self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.url = reverse("register")
 
     def test_register_view_get(self):
         """Test GET request to register view."""
@@ -964,24 +1150,22 @@ class RegisterViewTest(TestCase):
         self.assertFalse(Worker.objects.filter(username="newuser").exists())
 
 
-class TaskListViewTest(TestCase):
+class TaskListViewTest(LoggedInClientMixin, TestCase):
     """Test TaskListView."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.client.login(username="testuser", password="testpass123")
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.project = Project.objects.create(name="Test Project")
-        self.url = reverse("task_list")
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.project = Project.objects.create(name="Test Project")
+        cls.url = reverse("task_list")
 
     def test_task_list_view_requires_login(self):
         """Test task list view requires authentication."""
@@ -991,98 +1175,168 @@ class TaskListViewTest(TestCase):
 
     def test_task_list_view_get(self):
         """Test GET request to task list view."""
-        response = self.client.get(self.url)
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "tasks/task_list.html")
 
     def test_task_list_filter_by_status_completed(self):
         """Test filtering tasks by completed status."""
-        Task.objects.create(
-            name="Completed Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=True,
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-        Task.objects.create(
-            name="Incomplete Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=False,
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-
-        response = self.client.get(self.url, {"status": "completed"})
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name="Completed Task",
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=True,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+                Task(
+                    name="Incomplete Task",
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=False,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+            ]
+        )
+
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url, {"status": "completed"})
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context["tasks"]), 1)
-        self.assertTrue(response.context["tasks"][0].is_completed)
+        tasks = list(response.context["tasks"])
+        self.assertEqual(len(tasks), 1)
+        self.assertTrue(tasks[0].is_completed)
 
     def test_task_list_filter_by_priority(self):
         """Test filtering tasks by priority."""
-        Task.objects.create(
-            name="High Priority",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            priority="High",
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-        Task.objects.create(
-            name="Low Priority",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            priority="Low",
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-
-        response = self.client.get(self.url, {"priority": "High"})
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name="High Priority",
+                    description="Test",
+                    deadline=TOMORROW,
+                    priority="High",
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+                Task(
+                    name="Low Priority",
+                    description="Test",
+                    deadline=TOMORROW,
+                    priority="Low",
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+            ]
+        )
+
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url, {"priority": "High"})
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context["tasks"]), 1)
-        self.assertEqual(response.context["tasks"][0].priority, "High")
+        tasks = list(response.context["tasks"])
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].priority, "High")
 
     def test_task_list_search(self):
         """Test searching tasks."""
-        Task.objects.create(
-            name="Find Me",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-        Task.objects.create(
-            name="Other Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.user,
-        )
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name="Find Me",
+                    description="Test",
+                    deadline=TOMORROW,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+                Task(
+                    name="Other Task",
+                    description="Test",
+                    deadline=TOMORROW,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+            ]
+        )
+
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url, {"search": "Find Me"})
+        self.assertEqual(response.status_code, 200)
+        tasks = list(response.context["tasks"])
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].name, "Find Me")
+
 
-        response = self.client.get(self.url, {"search": "Find Me"})
+class MyTasksViewTest(LoggedInClientMixin, TestCase):
+    """Test MyTasksView."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
+            username="testuser",
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.completed_task, cls.incomplete_task, _ = Task.objects.bulk_create(
+            [
+                Task(
+                    name=name,
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=is_completed,
+                    task_type=cls.task_type,
+                    created_by=cls.user,
+                )
+                for name, is_completed in (
+                    ("Completed Task", True),
+                    ("Incomplete Task", False),
+                    ("Unassigned Task", False),
+                )
+            ]
+        )
+        Assignment = Task.assignees.through
+        Assignment.objects.bulk_create(
+            [
+                Assignment(task=task, worker=cls.user)
+                for task in (cls.completed_task, cls.incomplete_task)
+            ]
+        )
+        cls.url = reverse("my_tasks")
+
+    def test_my_tasks_split_by_status(self):
+        """Test assigned tasks are split by status from one query."""
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context["tasks"]), 1)
-        self.assertEqual(response.context["tasks"][0].name, "Find Me")
+        self.assertEqual(
+            response.context["completed_tasks"], [self.completed_task]
+        )
+        self.assertEqual(
+            response.context["incomplete_tasks"], [self.incomplete_task]
+        )
 
 
-class TaskCreateViewTest(TestCase):
+class TaskCreateViewTest(LoggedInClientMixin, TestCase):
     """Test TaskCreateView."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.client.login(username="testuser", password="testpass123")
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.url = reverse("task_create")
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.url = reverse("task_create")
 
     def test_task_create_view_requires_login(self):
         """Test task create view requires authentication."""
@@ -1101,146 +1355,253 @@ class TaskCreateViewTest(TestCase):
         data = {
             "name": "New Task",
             "description": "Test description",
-            "deadline": (
-                    timezone.now().date() + timedelta(days=1)).isoformat(),
+            "deadline": TOMORROW.isoformat(),
             "priority": "High",
             "task_type": self.task_type.id,
             "assignees": [self.user.id],  # Add required assignees
         }
         response = self.client.post(self.url, data)
         self.assertEqual(response.status_code, 302)
-        self.assertTrue(Task.objects.filter(name="New Task").exists())
+        task = Task.objects.filter(name="New Task").first()
+        self.assertIsNotNone(task)
 
         # Verify created_by is set automatically
-        task = Task.objects.get(name="New Task")
         self.assertEqual(task.created_by, self.user)
 
 
-class TaskUpdateViewTest(TestCase):
-    """Test TaskUpdateView."""
+class TaskDetailViewTest(LoggedInClientMixin, TestCase):
+    """Test TaskDetailView."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
-        )
-        self.other_user = Worker.objects.create_user(
-            username="otheruser",
-            email="other@example.com",
-            password="testpass123",
-            first_name="Other",
-            last_name="User",
-            position=self.position,
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                task_type=cls.task_type,
+                project=Project.objects.create(name="Test Project"),
+                created_by=cls.user,
+            )
+        workers = create_workers(
+            cls.position,
+            ("user1", "John", "Doe"),
+            ("user2", "Jane", "Smith"),
+        )
+        Assignment = Task.assignees.through
+        Assignment.objects.bulk_create(
+            [Assignment(task=cls.task, worker=worker) for worker in workers]
+        )
+        tags = Tag.objects.bulk_create(
+            [Tag(name="backend"), Tag(name="urgent")]
+        )
+        cls.task.tags.add(*tags)
+        Comment.objects.bulk_create(
+            [
+                Comment(task=cls.task, author=worker, content="Test")
+                for worker in workers
+            ]
+        )
+        cls.url = reverse("task_detail", kwargs={"pk": cls.task.pk})
+
+    def test_task_detail_query_count(self):
+        """Test related rows do not add queries per comment or assignee."""
+        with self.assertNumQueries(8):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["task"], self.task)
+
+    def test_task_activity_json(self):
+        """Test the activity endpoint serialises logs newest first."""
+        created, _ = ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task=self.task,
+                    user=self.user,
+                    activity_type=ActivityType.CREATED,
+                    description="Task created",
+                ),
+                ActivityLog(
+                    task=self.task,
+                    activity_type=ActivityType.UPDATED,
+                    description="Task updated",
+                ),
+            ]
+        )
+        # created_at is auto_now_add, so backdate the first log explicitly
+        ActivityLog.objects.filter(pk=created.pk).update(
+            created_at=timezone.now() - timedelta(hours=1)
+        )
+
+        response = self.client.get(
+            reverse("task_activity", kwargs={"pk": self.task.pk})
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.user,
+        self.assertEqual(response.status_code, 200)
+        activities = response.json()["activities"]
+        self.assertEqual(
+            [(a["user"], a["type"], a["description"]) for a in activities],
+            [
+                ("System", "Updated", "Task updated"),
+                ("John Doe", "Created", "Task created"),
+            ],
         )
-        self.url = reverse("task_edit", kwargs={"pk": self.task.pk})
 
-    def test_task_update_permission_creator(self):
-        """Test task creator can update task."""
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, 200)
 
-    def test_task_update_permission_non_creator(self):
-        """Test non-creator cannot update task."""
-        self.client.login(username="otheruser", password="testpass123")
-        response = self.client.get(self.url)
-        # Should return 404 because queryset filters by creator
-        self.assertEqual(response.status_code, 404)
-
-    def test_task_update_permission_staff(self):
-        """Test staff can update any task."""
-        self.other_user.is_staff = True
-        self.other_user.save()
-        self.client.login(username="otheruser", password="testpass123")
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, 200)
+class TaskUpdateViewTest(TestCase):
+    """Test TaskUpdateView."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user, cls.other_user, cls.staff_user = Worker.objects.bulk_create(
+            [
+                Worker(
+                    username="testuser",
+                    email="test@example.com",
+                    first_name="John",
+                    last_name="Doe",
+                    position=cls.position,
+                ),
+                Worker(
+                    username="otheruser",
+                    email="other@example.com",
+                    first_name="Other",
+                    last_name="User",
+                    position=cls.position,
+                ),
+                Worker(
+                    username="staffuser",
+                    email="staff@example.com",
+                    first_name="Staff",
+                    last_name="User",
+                    position=cls.position,
+                    is_staff=True,
+                ),
+            ]
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                task_type=cls.task_type,
+                created_by=cls.user,
+            )
+        cls.url = reverse("task_edit", kwargs={"pk": cls.task.pk})
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_task_update_permissions(self):
+        """Test only the creator and staff can update the task."""
+        # Other workers get a 404 because the queryset filters by creator
+        cases = [
+            (self.user, 200),
+            (self.other_user, 404),
+            (self.staff_user, 200),
+        ]
+        for user, expected_status in cases:
+            with self.subTest(user=user.username):
+                self.client.force_login(user)
+                response = self.client.get(self.url)
+                self.assertEqual(response.status_code, expected_status)
 
 
 class TaskDeleteViewTest(TestCase):
     """Test TaskDeleteView."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user, cls.other_user, cls.staff_user = Worker.objects.bulk_create(
+            [
+                Worker(
+                    username="testuser",
+                    email="test@example.com",
+                    first_name="John",
+                    last_name="Doe",
+                    position=cls.position,
+                ),
+                Worker(
+                    username="otheruser",
+                    email="other@example.com",
+                    first_name="Other",
+                    last_name="User",
+                    position=cls.position,
+                ),
+                Worker(
+                    username="staffuser",
+                    email="staff@example.com",
+                    first_name="Staff",
+                    last_name="User",
+                    position=cls.position,
+                    is_staff=True,
+                ),
+            ]
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                task_type=cls.task_type,
+                created_by=cls.user,
+            )
+        cls.url = reverse("task_delete", kwargs={"pk": cls.task.pk})
+
     def setUp(self):
         self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
-            username="testuser",
-            email="test@example.com",
-            password="testpass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.other_user = Worker.objects.create_user(
-            username="otheruser",
-            email="other@example.com",
-            password="testpass123",
-            first_name="Other",
-            last_name="User",
-            position=self.position,
-        )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-        self.url = reverse("task_delete", kwargs={"pk": self.task.pk})
-
-    def test_task_delete_permission_creator(self):
-        """Test task creator can delete task."""
-        self.client.login(username="testuser", password="testpass123")
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, 200)
 
-    def test_task_delete_permission_non_creator(self):
-        """Test non-creator cannot delete task."""
-        self.client.login(username="otheruser", password="testpass123")
-        response = self.client.get(self.url)
-        # Should return 404 because queryset filters by creator
-        self.assertEqual(response.status_code, 404)
+    def test_task_delete_permissions(self):
+        """Test only the creator and staff can delete the task."""
+        # Other workers get a 404 because the queryset filters by creator
+        cases = [
+            (self.user, 200),
+            (self.other_user, 404),
+            (self.staff_user, 200),
+        ]
+        for user, expected_status in cases:
+            with self.subTest(user=user.username):
+                self.client.force_login(user)
+                response = self.client.get(self.url)
+                self.assertEqual(response.status_code, expected_status)
 
 
-class TaskToggleStatusViewTest(TestCase):
+class TaskToggleStatusViewTest(LoggedInClientMixin, TestCase):
     """Test task_toggle_status view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
-        )
-        self.client.login(username="testuser", password="testpass123")
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=False,
-            task_type=self.task_type,
-            created_by=self.user,
-        )
-        self.url = reverse("task_toggle_status", kwargs={"pk": self.task.pk})
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                is_completed=False,
+                task_type=cls.task_type,
+                created_by=cls.user,
+            )
+        cls.url = reverse("task_toggle_status", kwargs={"pk": cls.task.pk})
 
     def test_toggle_status_incomplete_to_complete(self):
         """Test toggling task from incomplete to complete."""
@@ -1248,7 +1609,7 @@ class TaskToggleStatusViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
-        self.task.refresh_from_db()
+        self.task.refresh_from_db(fields=["is_completed"])
         self.assertTrue(self.task.is_completed)
 
     def test_toggle_status_complete_to_incomplete(self):
@@ -1259,27 +1620,31 @@ class TaskToggleStatusViewTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
-        self.task.refresh_from_db()
+        self.task.refresh_from_db(fields=["is_completed"])
         self.assertFalse(self.task.is_completed)
 
 
-class DashboardViewTest(TestCase):
+class DashboardViewTest(LoggedInClientMixin, TestCase):
     """Test dashboard view."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.client.login(username="testuser", password="testpass123")
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.url = reverse("dashboard")
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.url = reverse("dashboard")
+
+    def setUp(self):
+        super().setUp()
+        # Start every test from an empty cache so the priority statistics
+        # are queried and the pinned query counts hold in any order
+        cache.clear()
 
     def test_dashboard_requires_login(self):
         """Test dashboard requires authentication."""
@@ -1289,65 +1654,162 @@ class DashboardViewTest(TestCase):
 
     def test_dashboard_view_get(self):
         """Test GET request to dashboard."""
-        response = self.client.get(self.url)
+        with self.assertNumQueries(10):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, "tasks/dashboard.html")
 
     def test_dashboard_statistics(self):
         """Test dashboard displays correct statistics."""
         # Create tasks
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name="Completed",
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=True,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+                Task(
+                    name="Incomplete",
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=False,
+                    task_type=self.task_type,
+                    created_by=self.user,
+                ),
+            ]
+        )
+
+        with self.assertNumQueries(11):
+            response = self.client.get(self.url)
+        self.assertEqual(response.context["total_tasks"], 2)
+        self.assertEqual(response.context["completed_tasks"], 1)
+        self.assertEqual(response.context["incomplete_tasks"], 1)
+
+    def test_dashboard_priority_stats_cached(self):
+        """Test dashboard reuses the cached priority statistics."""
         Task.objects.create(
-            name="Completed",
+            name="Urgent",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=True,
+            deadline=TOMORROW,
+            priority="Urgent",
             task_type=self.task_type,
             created_by=self.user,
         )
-        Task.objects.create(
-            name="Incomplete",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            is_completed=False,
-            task_type=self.task_type,
-            created_by=self.user,
+        self.client.get(self.url)
+        Task.objects.filter(name="Urgent").update(priority="Low")
+
+        with self.assertNumQueries(10):
+            response = self.client.get(self.url)
+        self.assertEqual(
+            json.loads(response.context["priority_stats"]),
+            [{"priority": "Urgent", "count": 1}],
         )
 
-        response = self.client.get(self.url)
-        self.assertEqual(response.context["total_tasks"], 2)
-        self.assertEqual(response.context["completed_tasks"], 1)
-        self.assertEqual(response.context["incomplete_tasks"], 1)
+    def test_dashboard_project_task_counts(self):
+        """Test dashboard projects carry their task count."""
+        project = Project.objects.create(name="Test Project")
+        # Completed, so they stay out of the upcoming-deadline list
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name=name,
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=True,
+                    task_type=self.task_type,
+                    project=project,
+                    created_by=self.user,
+                )
+                for name in ("Task 1", "Task 2")
+            ]
+        )
+
+        with self.assertNumQueries(10):
+            response = self.client.get(self.url)
+        projects = list(response.context["projects"])
+        self.assertEqual(projects, [project])
+        self.assertEqual(projects[0].task_count, 2)
+
+    def test_dashboard_recent_activity(self):
+        """Test the activity feed renders without deferred-field loads."""
+        with disconnect_task_signals():
+            task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                is_completed=True,
+                task_type=self.task_type,
+                created_by=self.user,
+            )
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task=task,
+                    user=self.user,
+                    activity_type=ActivityType.UPDATED,
+                    description=f"Update {number}",
+                )
+                for number in range(3)
+            ]
+        )
 
+        with self.assertNumQueries(10):
+            response = self.client.get(self.url)
+        self.assertContains(response, "Update 2")
+        self.assertContains(response, self.user.get_full_name())
 
-class ProjectViewsTest(TestCase):
+
+class ProjectViewsTest(LoggedInClientMixin, TestCase):
     """Test project views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.client.login(username="testuser", password="testpass123")
+        cls.list_url = reverse("project_list")
+        cls.create_url = reverse("project_create")
 
     def test_project_list_view(self):
         """Test project list view."""
-        Project.objects.create(name="Project 1")
+        project = Project.objects.create(name="Project 1")
         Project.objects.create(name="Project 2")
-
-        response = self.client.get(reverse("project_list"))
+        Task.objects.bulk_create(
+            [
+                Task(
+                    name=name,
+                    description="Test",
+                    deadline=TOMORROW,
+                    project=project,
+                    created_by=self.user,
+                )
+                for name in ("Task 1", "Task 2")
+            ]
+        )
+        Team.objects.create(name="Team 1", project=project)
+
+        with self.assertNumQueries(6):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.context["projects"]), 2)
+        counts = {
+            project.name: (project.task_count, project.team_count)
+            for project in response.context["projects"]
+        }
+        self.assertEqual(counts, {"Project 1": (2, 1), "Project 2": (0, 0)})
 
     def test_project_create_view(self):
         """Test project create view."""
         data = {"name": "New Project", "description": "Test description"}
-        response = self.client.post(reverse("project_create"), data)
+        response = self.client.post(self.create_url, data)
         self.assertEqual(response.status_code, 302)
         self.assertTrue(Project.objects.filter(name="New Project").exists())
 
@@ -1359,83 +1821,232 @@ class ProjectViewsTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["project"], project)
 
+    def test_project_add_team_view(self):
+        """Test project add-team picker counts members in the query."""
+        project = Project.objects.create(name="Test Project")
+        other_project = Project.objects.create(name="Other Project")
+        team = Team.objects.create(name="Team 1", project=project)
+        team.members.add(self.user)
+        Team.objects.create(name="Team 2")
+        Team.objects.create(name="Team 3", project=other_project)
+
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                reverse("project_add_team", kwargs={"pk": project.pk})
+            )
+        self.assertEqual(response.status_code, 200)
+        counts = {
+            team.name: team.member_count
+            for team in response.context["available_teams"]
+        }
+        self.assertEqual(counts, {"Team 1": 1, "Team 2": 0})
+        self.assertContains(response, "вже в проекті", count=1)
 
-class TeamViewsTest(TestCase):
+
+class TeamViewsTest(LoggedInClientMixin, TestCase):
     """Test team views."""
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.client.login(username="testuser", password="testpass123")
+        cls.list_url = reverse("team_list")
+        cls.create_url = reverse("team_create")
 
     def test_team_list_view(self):
         """Test team list view."""
         Team.objects.create(name="Team 1")
         Team.objects.create(name="Team 2")
 
-        response = self.client.get(reverse("team_list"))
+        with self.assertNumQueries(7):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["teams"]), 2)
 
     def test_team_create_view(self):
         """Test team create view."""
         data = {"name": "New Team", "members": [self.user.id]}
-        response = self.client.post(reverse("team_create"), data)
+        response = self.client.post(self.create_url, data)
         self.assertEqual(response.status_code, 302)
         self.assertTrue(Team.objects.filter(name="New Team").exists())
 
+    def test_team_detail_view(self):
+        """Test team detail reads member task counts from the annotation."""
+        team = Team.objects.create(name="Team 1")
+        team.members.add(self.user)
+        with disconnect_task_signals():
+            tasks = Task.objects.bulk_create(
+                [
+                    Task(
+                        name=f"Task {number}",
+                        description="Test",
+                        deadline=TOMORROW,
+                        is_completed=number == 0,
+                        created_by=self.user,
+                    )
+                    for number in range(3)
+                ]
+            )
+            self.user.assigned_tasks.add(*tasks)
 
-class NotificationViewsTest(TestCase):
-    """Test notification views."""
+        with self.assertNumQueries(7):
+            response = self.client.get(
+                reverse("team_detail", kwargs={"pk": team.pk})
+            )
+        self.assertContains(response, "1 виконано")
+        self.assertContains(response, "2 в роботі")
+
+    def test_team_add_member_view(self):
+        """Test team add-member picker excludes the current members."""
+        team = Team.objects.create(name="Team 1")
+        team.members.add(self.user)
+        create_workers(
+            self.position,
+            ("worker1", "Jane", "Smith"),
+            ("worker2", "Bob", "Brown"),
+        )
+
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                reverse("team_add_member", kwargs={"pk": team.pk})
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertQuerySetEqual(
+            response.context["available_workers"],
+            ["worker1", "worker2"],
+            transform=lambda worker: worker.username,
+            ordered=False,
+        )
+        self.assertContains(response, "Developer", count=2)
+        self.assertFalse(response.context["has_more_workers"])
+
+    def test_team_add_member_view_search(self):
+        """Test team add-member picker narrows candidates by search."""
+        team = Team.objects.create(name="Team 1")
+        create_workers(
+            self.position,
+            ("worker1", "Jane", "Smith"),
+            ("worker2", "Bob", "Brown"),
+        )
+
+        response = self.client.get(
+            reverse("team_add_member", kwargs={"pk": team.pk}),
+            {"search": "smi"},
+        )
+        usernames = [
+            worker.username for worker in response.context["available_workers"]
+        ]
+        self.assertEqual(usernames, ["worker1"])
 
-    def setUp(self):
-        self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.user = Worker.objects.create_user(
+
+class TagViewsTest(LoggedInClientMixin, TestCase):
+    """Test tag views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
-        )
-        self.client.login(username="testuser", password="testpass123")
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
-            name="Test Task",
-            description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.user,
+            position=cls.position,
+        )
+        cls.tag = Tag.objects.create(name="Backend")
+        Tag.objects.create(name="Frontend")
+        tasks = Task.objects.bulk_create(
+            [
+                Task(
+                    name=f"Task {number}",
+                    description="Test",
+                    deadline=TOMORROW,
+                    is_completed=number % 3 == 0,
+                    created_by=cls.user,
+                )
+                for number in range(25)
+            ]
+        )
+        Task.tags.through.objects.bulk_create(
+            [Task.tags.through(task=task, tag=cls.tag) for task in tasks]
+        )
+        cls.list_url = reverse("tag_list")
+        cls.detail_url = reverse("tag_detail", kwargs={"pk": cls.tag.pk})
+
+    def test_tag_list_view(self):
+        """Test tag list view annotates the task counts."""
+        with self.assertNumQueries(6):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        counts = {tag.name: tag.task_count for tag in response.context["tags"]}
+        self.assertEqual(counts, {"Backend": 25, "Frontend": 0})
+
+    def test_tag_detail_view_paginates_tasks(self):
+        """Test tag detail counts every task but lists one page of them."""
+        with self.assertNumQueries(8):
+            response = self.client.get(self.detail_url, {"page": 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context["task_stats"],
+            {"total": 25, "completed": 9, "incomplete": 16},
         )
+        self.assertTrue(response.context["is_paginated"])
+        self.assertEqual(len(response.context["tasks"]), 5)
+
+
+class NotificationViewsTest(LoggedInClientMixin, TestCase):
+    """Test notification views."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.user = Worker.objects.create(
+            username="testuser",
+            email="test@example.com",
+            first_name="John",
+            last_name="Doe",
+            position=cls.position,
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                task_type=cls.task_type,
+                created_by=cls.user,
+            )
+        cls.list_url = reverse("notifications_list")
+        cls.mark_all_read_url = reverse("notification_mark_all_read")
 
     def test_notification_list_view(self):
         """Test notification list view."""
         Notification.objects.create(
             recipient=self.user,
-            notification_type="task_assigned",
+            notification_type=NotificationType.TASK_ASSIGNED,
             title="Test",
             message="Test message",
             task=self.task,
         )
 
-        response = self.client.get(reverse("notifications_list"))
+        with self.assertNumQueries(8):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context["notifications"]), 1)
+        self.assertContains(
+            response, reverse("task_detail", kwargs={"pk": self.task.pk})
+        )
 
     def test_notification_mark_read(self):
         """Test marking notification as read."""
         notification = Notification.objects.create(
             recipient=self.user,
-            notification_type="task_assigned",
+            notification_type=NotificationType.TASK_ASSIGNED,
             title="Test",
             message="Test message",
             task=self.task,
@@ -1446,154 +2057,306 @@ class NotificationViewsTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 302)
 
-        notification.refresh_from_db()
+        notification.refresh_from_db(fields=["is_read"])
         self.assertTrue(notification.is_read)
 
     def test_notification_mark_all_read(self):
         """Test marking all notifications as read."""
-        Notification.objects.create(
-            recipient=self.user,
-            notification_type="task_assigned",
-            title="Test 1",
-            message="Test",
-            task=self.task,
-            is_read=False,
-        )
-        Notification.objects.create(
-            recipient=self.user,
-            notification_type="task_assigned",
-            title="Test 2",
-            message="Test",
-            task=self.task,
-            is_read=False,
-        )
-
-        response = self.client.get(reverse("notification_mark_all_read"))
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=self.user,
+                    notification_type=NotificationType.TASK_ASSIGNED,
+                    title="Test 1",
+                    message="Test",
+                    task=self.task,
+                    is_read=False,
+                ),
+                Notification(
+                    recipient=self.user,
+                    notification_type=NotificationType.TASK_ASSIGNED,
+                    title="Test 2",
+                    message="Test",
+                    task=self.task,
+                    is_read=False,
+                ),
+            ]
+        )
+
+        response = self.client.get(self.mark_all_read_url)
         self.assertEqual(response.status_code, 302)
 
-        unread_count = Notification.objects.filter(
-            recipient=self.user, is_read=False
-        ).count()
-        self.assertEqual(unread_count, 0)
+        self.assertFalse(
+            Notification.objects.filter(
+                recipient=self.user, is_read=False
+            ).exists()
+        )
 
 
-class PositionViewsTest(TestCase):
+class PositionViewsTest(SuperuserFixtureMixin, TestCase):
     """Test position views (superuser only)."""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.list_url = reverse("position_list")
+        cls.create_url = reverse("position_create")
+
     def setUp(self):
         self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.superuser = Worker.objects.create_superuser(
-            username="admin",
-            email="admin@example.com",
-            password="adminpass123",
-            first_name="Admin",
-            last_name="User",
-        )
-        self.regular_user = Worker.objects.create_user(
-            username="regular",
-            email="regular@example.com",
-            password="pass123",
-            first_name="Regular",
-            last_name="User",
-            position=self.position,
-        )
 
     def test_position_list_requires_superuser(self):
         """Test position list requires superuser."""
-        self.client.login(username="regular", password="pass123")
-        response = self.client.get(reverse("position_list"))
+        self.client.force_login(self.regular_user)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 403)  # Forbidden
 
     def test_position_list_superuser_access(self):
         """Test superuser can access position list."""
-        self.client.login(username="admin", password="adminpass123")
-        response = self.client.get(reverse("position_list"))
+        self.client.force_login(self.superuser)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
 
     def test_position_create_requires_superuser(self):
         """Test position create requires superuser."""
-        self.client.login(username="regular", password="pass123")
-        response = self.client.get(reverse("position_create"))
+        self.client.force_login(self.regular_user)
+        response = self.client.get(self.create_url)
         self.assertEqual(response.status_code, 403)
 
 
-class WorkerManagementViewsTest(TestCase):
+class WorkerManagementViewsTest(SuperuserFixtureMixin, TestCase):
     """Test worker management views (superuser only)."""
 
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.list_url = reverse("worker_list")
+        cls.edit_url = reverse(
+            "worker_edit", kwargs={"pk": cls.regular_user.pk}
+        )
+
     def setUp(self):
         self.client = Client()
-        self.position = Position.objects.create(name="Developer")
-        self.superuser = Worker.objects.create_superuser(
-            username="admin",
-            email="admin@example.com",
-            password="adminpass123",
-            first_name="Admin",
-            last_name="User",
-        )
-        self.regular_user = Worker.objects.create_user(
-            username="regular",
-            email="regular@example.com",
-            password="pass123",
-            first_name="Regular",
-            last_name="User",
-            position=self.position,
-        )
 
     def test_worker_list_requires_superuser(self):
         """Test worker list requires superuser."""
-        self.client.login(username="regular", password="pass123")
-        response = self.client.get(reverse("worker_list"))
+        self.client.force_login(self.regular_user)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 403)
 
     def test_worker_list_superuser_access(self):
         """Test superuser can access worker list."""
-        self.client.login(username="admin", password="adminpass123")
-        response = self.client.get(reverse("worker_list"))
+        self.client.force_login(self.superuser)
+        response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
 
+    def test_worker_list_search(self):
+        """Test worker list search matches names."""
+        self.client.force_login(self.superuser)
+        response = self.client.get(self.list_url, {"search": "regular"})
+        self.assertQuerySetEqual(
+            response.context["workers"], [self.regular_user]
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "Uses search_vector")
+    def test_worker_list_search_matches_prefixes(self):
+        """Test worker list search keeps partial name and email matches."""
+        self.client.force_login(self.superuser)
+        cases = [
+            ("reg", [self.regular_user]),
+            ("Use", [self.superuser, self.regular_user]),
+            ("regular@example.com", [self.regular_user]),
+            ("adm use", [self.superuser]),
+        ]
+        for search, workers in cases:
+            with self.subTest(search=search):
+                response = self.client.get(self.list_url, {"search": search})
+                self.assertQuerySetEqual(
+                    response.context["workers"], workers, ordered=False
+                )
+
     def test_worker_update_requires_superuser(self):
         """Test worker update requires superuser."""
-        self.client.login(username="regular", password="pass123")
-        url = reverse("worker_edit", kwargs={"pk": self.regular_user.pk})
-        response = self.client.get(url)
+        self.client.force_login(self.regular_user)
+        response = self.client.get(self.edit_url)
         self.assertEqual(response.status_code, 403)
 
 
+class AdminChangelistTest(LoggedInClientMixin, SuperuserFixtureMixin,
+                          TestCase):
+    """Test admin changelists join what they display."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = cls.superuser
+        authors = create_workers(
+            cls.position,
+            *[(f"worker{number}", "Jane", f"Smith{number}")
+              for number in range(5)],
+        )
+        with disconnect_task_signals():
+            cls.task = Task.objects.create(
+                name="Test Task",
+                description="Test",
+                deadline=TOMORROW,
+                created_by=cls.regular_user,
+            )
+        Comment.objects.bulk_create(
+            [
+                Comment(task=cls.task, author=author, content="Comment")
+                for author in authors
+            ]
+        )
+        ActivityLog.objects.bulk_create(
+            [
+                ActivityLog(
+                    task=cls.task,
+                    user=authors[number % 5],
+                    activity_type=ActivityType.UPDATED,
+                    description="Task updated",
+                )
+                for number in range(20)
+            ]
+        )
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    recipient=authors[number % 5],
+                    notification_type=NotificationType.TASK_UPDATED,
+                    title="Task updated",
+                    message="Task updated",
+                    task=cls.task,
+                )
+                for number in range(20)
+            ]
+        )
+        Team.objects.bulk_create(
+            [
+                Team(
+                    name=f"Team {number}",
+                    project=Project.objects.create(name=f"Project {number}"),
+                )
+                for number in range(3)
+            ]
+        )
+
+    def test_changelist_queries(self):
+        """Test changelists do not look up related rows per row."""
+        cases = [
+            ("tasks_comment_changelist", 7, 5),
+            ("tasks_activitylog_changelist", 7, 20),
+            ("tasks_notification_changelist", 7, 20),
+            ("tasks_task_changelist", 8, 1),
+            ("tasks_team_changelist", 6, 3),
+        ]
+        for url_name, num_queries, num_rows in cases:
+            with self.subTest(url_name=url_name):
+                with self.assertNumQueries(num_queries):
+                    response = self.client.get(reverse(f"admin:{url_name}"))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    len(response.context["cl"].result_list), num_rows
+                )
+
+    def test_task_change_form_queries(self):
+        """Test the task change form loads its row in one query."""
+        self.task.assignees.add(self.regular_user)
+        # The admin looks the content type up once per process; clear it so
+        # the count does not depend on which test ran first
+        ContentType.objects.clear_cache()
+        with self.assertNumQueries(10):
+            response = self.client.get(
+                reverse("admin:tasks_task_change", args=[self.task.pk])
+            )
+        self.assertEqual(response.status_code, 200)
+
+    def test_add_forms_autocomplete_foreign_keys(self):
+        """Test FK selects load their choices through autocomplete."""
+        cases = [
+            ("tasks_comment_add", ["task", "author"]),
+            ("tasks_notification_add", ["recipient", "task"]),
+        ]
+        for url_name, field_names in cases:
+            response = self.client.get(reverse(f"admin:{url_name}"))
+            form = response.context["adminform"].form
+            for field_name in field_names:
+                with self.subTest(url_name=url_name, field=field_name):
+                    html = str(form[field_name])
+                    self.assertIn("admin-autocomplete", html)
+                    self.assertNotIn(str(self.task), html)
+
+    def test_export_activity_csv(self):
+        """Test the CSV export streams a header and one row per log."""
+        log_ids = list(ActivityLog.objects.values_list("pk", flat=True)[:3])
+        response = self.client.post(
+            reverse("admin:tasks_activitylog_changelist"),
+            {"action": "export_activity_csv", "_selected_action": log_ids},
+        )
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(
+                b"".join(response.streaming_content).decode().splitlines()
+            )
+        )
+        self.assertEqual(
+            rows[0],
+            ["Created At", "Activity Type", "Task", "User", "Description"],
+        )
+        self.assertEqual(len(rows), 1 + len(log_ids))
+        self.assertEqual(
+            {(row[1], row[2]) for row in rows[1:]},
+            {("Updated", "Test Task")},
+        )
+
+    def test_comment_search(self):
+        """Test admin search prefix-matches and requires every word."""
+        url = reverse("admin:tasks_comment_changelist")
+        cases = [
+            ("comm", 5),
+            ("comm worker1", 1),
+            ("comm nobody", 0),
+        ]
+        for search, num_rows in cases:
+            with self.subTest(search=search):
+                response = self.client.get(url, {"q": search})
+                self.assertEqual(
+                    len(response.context["cl"].result_list), num_rows
+                )
+
+
 class TaskPostSaveSignalTest(TestCase):
     """Test task_post_save signal."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker = Worker.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker = Worker.objects.create(
             username="testuser",
             email="test@example.com",
-            password="testpass123",
             first_name="John",
             last_name="Doe",
-            position=self.position,
+            position=cls.position,
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
 
     def test_activity_log_created_on_task_creation(self):
         """Test activity log is created when task is created."""
-        initial_count = ActivityLog.objects.count()
-
         task = Task.objects.create(
             name="Test Task",
             description="Test description",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=TOMORROW,
             task_type=self.task_type,
             created_by=self.worker,
         )
 
-        # Check activity log was created
-        self.assertEqual(ActivityLog.objects.count(), initial_count + 1)
+        # Check a single activity log was created
+        logs = list(ActivityLog.objects.filter(task=task))
+        self.assertEqual(len(logs), 1)
 
         # Verify activity log details
-        log = ActivityLog.objects.filter(task=task,
-                                         activity_type="created").first()
-        self.assertIsNotNone(log)
+        log = logs[0]
+        self.assertEqual(log.activity_type, ActivityType.CREATED)
         self.assertEqual(log.user, self.worker)
         self.assertIn(task.name, log.description)
 
@@ -1602,100 +2365,102 @@ class TaskPostSaveSignalTest(TestCase):
         task = Task.objects.create(
             name="Test Task",
             description="Test description",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=TOMORROW,
             task_type=self.task_type,
             created_by=self.worker,
             is_completed=False,
         )
 
-        # Clear existing logs
-        initial_count = ActivityLog.objects.filter(
-            task=task, activity_type="completed"
-        ).count()
-
         # Mark task as completed
         task.is_completed = True
         task.save()
 
         # Check activity log was created
-        completed_logs = ActivityLog.objects.filter(
-            task=task, activity_type="completed"
-        )
-        self.assertEqual(completed_logs.count(), initial_count + 1)
+        completed_logs = list(ActivityLog.objects.filter(
+            task=task, activity_type=ActivityType.COMPLETED
+        ))
+        self.assertEqual(len(completed_logs), 1)
 
         # Verify activity log details
-        log = completed_logs.first()
-        self.assertIsNotNone(log)
+        log = completed_logs[0]
         self.assertIn(task.name, log.description)
 
+    def test_no_activity_log_when_status_not_saved(self):
+        """Test saves that skip is_completed create no completion log."""
+        task = Task.objects.create(
+            name="Test Task",
+            description="Test description",
+            deadline=TOMORROW,
+            task_type=self.task_type,
+            created_by=self.worker,
+            is_completed=True,
+        )
+
+        task.name = "Renamed Task"
+        task.save(update_fields=["name"])
+
+        self.assertFalse(
+            ActivityLog.objects.filter(
+                task=task, activity_type=ActivityType.COMPLETED
+            ).exists()
+        )
+
 
 class TaskAssigneesChangedSignalTest(TestCase):
     """Test task_assignees_changed signal."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.worker1 = Worker.objects.create_user(
-            username="user1",
-            email="user1@example.com",
-            password="pass123",
-            first_name="John",
-            last_name="Doe",
-            position=self.position,
-        )
-        self.worker2 = Worker.objects.create_user(
-            username="user2",
-            email="user2@example.com",
-            password="pass123",
-            first_name="Jane",
-            last_name="Smith",
-            position=self.position,
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.worker1, cls.worker2 = create_workers(
+            cls.position,
+            ("user1", "John", "Doe"),
+            ("user2", "Jane", "Smith"),
         )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.task = Task.objects.create(
             name="Test Task",
             description="Test description",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.worker1,
+            deadline=TOMORROW,
+            task_type=cls.task_type,
+            created_by=cls.worker1,
         )
 
     def test_notification_created_on_assignment(self):
         """Test notification is created when worker is assigned to task."""
-        initial_count = Notification.objects.filter(
-            recipient=self.worker2).count()
-
-        # Assign worker to task
-        self.task.assignees.add(self.worker2)
+        # Assign worker to task: existing-row check, through insert, name
+        # lookup, notification insert and activity log insert
+        with self.assertNumQueries(5):
+            self.task.assignees.add(self.worker2)
 
         # Check notification was created
-        notifications = Notification.objects.filter(recipient=self.worker2)
-        self.assertEqual(notifications.count(), initial_count + 1)
+        notifications = list(
+            Notification.objects.filter(recipient=self.worker2)
+        )
+        self.assertEqual(len(notifications), 1)
 
         # Verify notification details
-        notification = notifications.filter(
-            notification_type="task_assigned").first()
-        self.assertIsNotNone(notification)
+        notification = notifications[0]
+        self.assertEqual(
+            notification.notification_type, NotificationType.TASK_ASSIGNED
+        )
         self.assertEqual(notification.task, self.task)
         self.assertIn(self.task.name, notification.message)
         self.assertFalse(notification.is_read)
 
     def test_activity_log_created_on_assignment(self):
         """Test activity log is created when worker is assigned to task."""
-        initial_count = ActivityLog.objects.filter(
-            task=self.task, activity_type="assigned"
-        ).count()
-
         # Assign worker to task
         self.task.assignees.add(self.worker2)
 
         # Check activity log was created
-        logs = ActivityLog.objects.filter(
-            task=self.task, activity_type="assigned")
-        self.assertEqual(logs.count(), initial_count + 1)
+        logs = list(ActivityLog.objects.filter(
+            task=self.task, activity_type=ActivityType.ASSIGNED))
+        self.assertEqual(len(logs), 1)
 
         # Verify activity log details
-        log = logs.filter(user=self.worker2).first()
-        self.assertIsNotNone(log)
+        log = logs[0]
+        self.assertEqual(log.user, self.worker2)
         self.assertIn(self.worker2.get_full_name(), log.description)
 
     def test_activity_log_created_on_unassignment(self):
@@ -1703,100 +2468,84 @@ class TaskAssigneesChangedSignalTest(TestCase):
         # First assign worker
         self.task.assignees.add(self.worker2)
 
-        initial_count = ActivityLog.objects.filter(
-            task=self.task, activity_type="unassigned"
-        ).count()
-
         # Remove worker from task
         self.task.assignees.remove(self.worker2)
 
         # Check activity log was created
-        logs = ActivityLog.objects.filter(
-            task=self.task, activity_type="unassigned")
-        self.assertEqual(logs.count(), initial_count + 1)
+        logs = list(ActivityLog.objects.filter(
+            task=self.task, activity_type=ActivityType.UNASSIGNED))
+        self.assertEqual(len(logs), 1)
 
         # Verify activity log details
-        log = logs.filter(user=self.worker2).first()
-        self.assertIsNotNone(log)
+        log = logs[0]
+        self.assertEqual(log.user, self.worker2)
         self.assertIn(self.worker2.get_full_name(), log.description)
 
     def test_multiple_assignees_create_multiple_notifications(self):
         """Test multiple workers get notifications when assigned."""
-        initial_count1 = Notification.objects.filter(
-            recipient=self.worker1).count()
-        initial_count2 = Notification.objects.filter(
-            recipient=self.worker2).count()
-
-        # Assign both workers
-        self.task.assignees.add(self.worker1, self.worker2)
+        # Assign both workers; the handler's queries do not grow with the
+        # number of assignees
+        with self.assertNumQueries(5):
+            self.task.assignees.add(self.worker1, self.worker2)
 
         # Check both got notifications
-        self.assertEqual(
-            Notification.objects.filter(recipient=self.worker1).count(),
-            initial_count1 + 1,
-        )
-        self.assertEqual(
-            Notification.objects.filter(recipient=self.worker2).count(),
-            initial_count2 + 1,
+        counts = dict(
+            Notification.objects.values("recipient")
+            .annotate(count=Count("id"))
+            .values_list("recipient", "count")
         )
+        self.assertEqual(counts, {self.worker1.pk: 1, self.worker2.pk: 1})
 
 
 class CommentPostSaveSignalTest(TestCase):
     """Test comment_post_save signal."""
 
-    def setUp(self):
-        self.position = Position.objects.create(name="Developer")
-        self.task_creator = Worker.objects.create_user(
-            username="creator",
-            email="creator@example.com",
-            password="pass123",
-            first_name="Task",
-            last_name="Creator",
-            position=self.position,
-        )
-        self.assignee1 = Worker.objects.create_user(
-            username="assignee1",
-            email="assignee1@example.com",
-            password="pass123",
-            first_name="Assignee",
-            last_name="One",
-            position=self.position,
-        )
-        self.assignee2 = Worker.objects.create_user(
-            username="assignee2",
-            email="assignee2@example.com",
-            password="pass123",
-            first_name="Assignee",
-            last_name="Two",
-            position=self.position,
-        )
-        self.commenter = Worker.objects.create_user(
-            username="commenter",
-            email="commenter@example.com",
-            password="pass123",
-            first_name="Comment",
-            last_name="Author",
-            position=self.position,
-        )
-        self.task_type = TaskType.objects.create(name="Bug Fix")
-        self.task = Task.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        (
+            cls.task_creator,
+            cls.assignee1,
+            cls.assignee2,
+            cls.commenter,
+        ) = create_workers(
+            cls.position,
+            ("creator", "Task", "Creator"),
+            ("assignee1", "Assignee", "One"),
+            ("assignee2", "Assignee", "Two"),
+            ("commenter", "Comment", "Author"),
+        )
+        cls.task_type = TaskType.objects.create(name="Bug Fix")
+        cls.task = Task.objects.create(
             name="Test Task",
             description="Test description",
-            deadline=timezone.now().date() + timedelta(days=1),
-            task_type=self.task_type,
-            created_by=self.task_creator,
+            deadline=TOMORROW,
+            task_type=cls.task_type,
+            created_by=cls.task_creator,
+        )
+        # Insert the through rows directly so m2m_changed does not fan out
+        # assignment notifications these tests never look at
+        Assignment = Task.assignees.through
+        Assignment.objects.bulk_create(
+            [
+                Assignment(task=cls.task, worker=worker)
+                for worker in (cls.assignee1, cls.assignee2)
+            ]
         )
-        self.task.assignees.add(self.assignee1, self.assignee2)
 
     def test_activity_log_created_on_comment(self):
         """Test activity log is created when comment is added."""
         initial_count = ActivityLog.objects.filter(
-            task=self.task, activity_type="commented"
+            task=self.task, activity_type=ActivityType.COMMENTED
         ).count()
 
+        Comment.objects.create(
+            task=self.task, author=self.commenter, content="Test comment"
+        )
+
         # Check activity log was created
         logs = ActivityLog.objects.filter(
-            task=self.task, activity_type="commented")
+            task=self.task, activity_type=ActivityType.COMMENTED)
         self.assertEqual(logs.count(), initial_count + 1)
 
         # Verify activity log details
@@ -1807,30 +2556,30 @@ class CommentPostSaveSignalTest(TestCase):
     def test_notifications_created_for_assignees(self):
         """Test notifications are created for assignees
         when comment is added."""
-        # Comment author should not receive notification
-        initial_count1 = Notification.objects.filter(
-            recipient=self.assignee1).count()
-        initial_count2 = Notification.objects.filter(
-            recipient=self.assignee2).count()
-
-        # Create comment
-        Comment.objects.create(
-            task=self.task, author=self.commenter, content="Test comment"
-        )
+        # Comment, assignee lookup, activity log, assignee notifications
+        # and the creator's notification
+        with self.assertNumQueries(5):
+            Comment.objects.create(
+                task=self.task, author=self.commenter, content="Test comment"
+            )
 
         # Check notifications were created for assignees
-        self.assertEqual(
-            Notification.objects.filter(recipient=self.assignee1).count(),
-            initial_count1 + 1,
+        counts = dict(
+            Notification.objects.filter(
+                recipient__in=[self.assignee1, self.assignee2]
+            )
+            .values("recipient")
+            .annotate(count=Count("id"))
+            .values_list("recipient", "count")
         )
         self.assertEqual(
-            Notification.objects.filter(recipient=self.assignee2).count(),
-            initial_count2 + 1,
+            counts, {self.assignee1.pk: 1, self.assignee2.pk: 1}
         )
 
         # Verify notification details
         notification = Notification.objects.filter(
-            recipient=self.assignee1, notification_type="task_commented"
+            recipient=self.assignee1,
+            notification_type=NotificationType.TASK_COMMENTED,
         ).first()
         self.assertIsNotNone(notification)
         self.assertEqual(notification.task, self.task)
@@ -1839,40 +2588,37 @@ class CommentPostSaveSignalTest(TestCase):
     def test_comment_author_does_not_receive_notification(self):
         """Test comment author does not receive notification."""
         # Assignee1 is both assignee and commenter
-        initial_count = Notification.objects.filter(
-            recipient=self.assignee1, notification_type="task_commented"
-        ).count()
-
         # Create comment by assignee1
         Comment.objects.create(
             task=self.task, author=self.assignee1, content="Test comment"
         )
 
         # Assignee1 should not receive notification for their own comment
-        new_count = Notification.objects.filter(
-            recipient=self.assignee1, notification_type="task_commented"
-        ).count()
-        self.assertEqual(new_count, initial_count)
+        self.assertFalse(
+            Notification.objects.filter(
+                recipient=self.assignee1,
+                notification_type=NotificationType.TASK_COMMENTED,
+            ).exists()
+        )
 
     def test_task_creator_receives_notification(self):
         """Test task creator receives notification if not an assignee."""
-        initial_count = Notification.objects.filter(
-            recipient=self.task_creator).count()
-
         # Create comment
         Comment.objects.create(
             task=self.task, author=self.commenter, content="Test comment"
         )
 
         # Task creator should receive notification
-        notifications = Notification.objects.filter(
-            recipient=self.task_creator)
-        self.assertEqual(notifications.count(), initial_count + 1)
+        notifications = list(
+            Notification.objects.filter(recipient=self.task_creator)
+        )
+        self.assertEqual(len(notifications), 1)
 
         # Verify notification details
-        notification = notifications.filter(
-            notification_type="task_commented").first()
-        self.assertIsNotNone(notification)
+        notification = notifications[0]
+        self.assertEqual(
+            notification.notification_type, NotificationType.TASK_COMMENTED
+        )
         self.assertIn("your task", notification.message)
 
     def test_task_creator_as_assignee_receives_one_notification(self):
@@ -1882,16 +2628,12 @@ class CommentPostSaveSignalTest(TestCase):
         new_task = Task.objects.create(
             name="New Task",
             description="Test",
-            deadline=timezone.now().date() + timedelta(days=1),
+            deadline=TOMORROW,
             task_type=self.task_type,
             created_by=self.task_creator,
         )
         new_task.assignees.add(self.task_creator)
 
-        initial_count = Notification.objects.filter(
-            recipient=self.task_creator, notification_type="task_commented"
-        ).count()
-
         # Create comment
         Comment.objects.create(
             task=new_task, author=self.commenter, content="Test comment"
@@ -1899,6 +2641,7 @@ class CommentPostSaveSignalTest(TestCase):
 
         # Task creator should receive only one notification
         new_count = Notification.objects.filter(
-            recipient=self.task_creator, notification_type="task_commented"
+            recipient=self.task_creator,
+            notification_type=NotificationType.TASK_COMMENTED,
         ).count()
-        self.assertEqual(new_count, initial_count + 1)
+        self.assertEqual(new_count, 1)
@@ -3,7 +3,10 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.contrib.auth import login
 from django.contrib import messages
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Q, Count, Prefetch
 from django.http import JsonResponse
 from django.utils import timezone
 from django.views.generic import (
@@ -15,6 +18,7 @@ from django.views.generic import (
 )
 from django.urls import reverse_lazy
 from datetime import timedelta
+import json
 from .models import (
     Task,
     Worker,
@@ -24,6 +28,8 @@ from .models import (
     ActivityLog,
     Notification,
     Position,
+    Comment,
+    prefix_search_query,
 )
 from .forms import (
     TaskForm,
@@ -113,11 +119,21 @@ class MyTasksView(LoginRequiredMixin, ListView):
     template_name = "tasks/my_task.html"
     context_object_name = "tasks"
 
+    def get_queryset(self):
+        return self.request.user.assigned_tasks.select_related(
+            "task_type"
+        ).prefetch_related("tags")
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        worker = self.request.user
-        context["completed_tasks"] = worker.get_completed_tasks()
-        context["incomplete_tasks"] = worker.get_incomplete_tasks()
+        # Load the worker's tasks once and split them by status in Python
+        tasks = list(context["tasks"])
+        context["completed_tasks"] = [
+            task for task in tasks if task.is_completed
+        ]
+        context["incomplete_tasks"] = [
+            task for task in tasks if not task.is_completed
+        ]
         return context
 
 
@@ -149,6 +165,29 @@ class TaskDetailView(LoginRequiredMixin, DetailView):
     template_name = "tasks/task_detail.html"
     context_object_name = "task"
 
+    def get_queryset(self):
+        # The activity tab loads over AJAX, so only what the page renders
+        # is fetched here. Prefetching the comments fills their task
+        # directly, so only the author needs joining.
+        return (
+            super()
+            .get_queryset()
+            .select_related("task_type", "project", "created_by")
+            .prefetch_related(
+                Prefetch(
+                    "assignees",
+                    queryset=Worker.objects.select_related("position"),
+                ),
+                "tags",
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related(
+                        None
+                    ).select_related("author"),
+                ),
+            )
+        )
+
 
 class TaskUpdateView(LoginRequiredMixin, UpdateView):
     """Edit a task."""
@@ -220,7 +259,7 @@ def task_toggle_status(request, pk):
         task.mark_as_incomplete()
         messages.info(request, f'Task "{task.name}" marked as incomplete')
     else:
-        task.mark_as_completed()
+        task.mark_as_completed(user=request.user)
         messages.success(request, f'Task "{task.name}" marked as completed!')
 
     return redirect("task_detail", pk=task.pk)
@@ -238,7 +277,12 @@ class ProjectListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Project.objects.all().prefetch_related("tasks", "teams")
+        # The list only shows how many tasks and teams each project has.
+        # Both relations are joined at once, so the counts are distinct.
+        queryset = Project.objects.annotate(
+            task_count=Count("tasks", distinct=True),
+            team_count=Count("teams", distinct=True),
+        )
 
         # Search filtering
         search = self.request.GET.get("search", "")
@@ -367,7 +411,10 @@ class TeamDetailView(LoginRequiredMixin, DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["members"] = (
-            self.object.members.all().select_related("position"))
+            Worker.objects.with_task_stats()
+            .filter(teams=self.object)
+            .select_related("position")
+        )
         return context
 
 
@@ -443,6 +490,8 @@ def project_add_team(request, pk):
     # Get teams that are not assigned to any project or to this project
     available_teams = (
         Team.objects.filter(Q(project__isnull=True) | Q(project=project))
+        .only("id", "name", "project")
+        .annotate(member_count=Count("members"))
     )
 
     context = {
@@ -471,6 +520,9 @@ def project_remove_team(request, pk, team_pk):
     return render(request, "tasks/project_remove_team.html", context)
 
 
+TEAM_MEMBER_CHOICES_LIMIT = 200
+
+
 @login_required
 def team_add_member(request, pk):
     """Add a member to a team."""
@@ -485,13 +537,40 @@ def team_add_member(request, pk):
                              f'User "{member.get_full_name()}" added to team!')
         return redirect("team_detail", pk=team.pk)
 
-    # Get workers not in this team
-    current_members = team.members.all()
-    available_workers = Worker.objects.exclude(id__in=current_members)
+    # Get workers not in this team; the member ids are an SQL subquery and
+    # the picker only needs the names and position of each candidate
+    available_workers = (
+        Worker.objects.exclude(id__in=team.members.values("id"))
+        .select_related("position")
+        .only(
+            "id",
+            "username",
+            "first_name",
+            "last_name",
+            "position__name",
+        )
+        .order_by("last_name", "first_name")
+    )
+
+    # Search filtering
+    search = request.GET.get("search", "")
+    if search:
+        available_workers = available_workers.filter(
+            Q(username__icontains=search)
+            | Q(first_name__icontains=search)
+            | Q(last_name__icontains=search)
+        )
+
+    # The picker is a plain <select>, so it is capped and the search is
+    # used to narrow it down; one extra row tells whether it was cut short
+    available_workers = list(available_workers[:TEAM_MEMBER_CHOICES_LIMIT + 1])
+    has_more_workers = len(available_workers) > TEAM_MEMBER_CHOICES_LIMIT
 
     context = {
         "team": team,
-        "available_workers": available_workers,
+        "available_workers": available_workers[:TEAM_MEMBER_CHOICES_LIMIT],
+        "has_more_workers": has_more_workers,
+        "search": search,
     }
     return render(request, "tasks/team_add_member.html", context)
 
@@ -527,7 +606,7 @@ class TagListView(LoginRequiredMixin, ListView):
     paginate_by = 10
 
     def get_queryset(self):
-        queryset = Tag.objects.all().prefetch_related("tasks")
+        queryset = Tag.objects.annotate(task_count=Count("tasks"))
 
         # Search filtering
         search = self.request.GET.get("search", "")
@@ -542,6 +621,9 @@ class TagListView(LoginRequiredMixin, ListView):
         return context
 
 
+TAG_TASKS_PER_PAGE = 20
+
+
 class TagDetailView(LoginRequiredMixin, DetailView):
     """Detailed information about a tag."""
 
@@ -551,11 +633,21 @@ class TagDetailView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["tasks"] = (
-            self.object.tasks.all()
-            .select_related("task_type", "project", "created_by")
-            .prefetch_related("assignees")
+        tasks = self.object.tasks.select_related("project")
+
+        # The statistics cover every tagged task, not just the current page
+        context["task_stats"] = tasks.aggregate(
+            total=Count("id"),
+            completed=Count("id", filter=Q(is_completed=True)),
+            incomplete=Count("id", filter=Q(is_completed=False)),
         )
+
+        page_obj = Paginator(tasks, TAG_TASKS_PER_PAGE).get_page(
+            self.request.GET.get("page")
+        )
+        context["tasks"] = page_obj
+        context["page_obj"] = page_obj
+        context["is_paginated"] = page_obj.has_other_pages()
         return context
 
 
@@ -614,63 +706,78 @@ class TagDeleteView(LoginRequiredMixin, DeleteView):
 
 # ==================== DASHBOARD ====================
 
+PRIORITY_STATS_CACHE_KEY = "dashboard:priority_stats"
+PRIORITY_STATS_CACHE_TIMEOUT = 60
+
 
 @login_required
 def dashboard(request):
     """Dashboard with statistics."""
     user = request.user
-
-    # General statistics
-    total_tasks = Task.objects.count()
-    completed_tasks = Task.objects.filter(is_completed=True).count()
-    incomplete_tasks = Task.objects.filter(is_completed=False).count()
+    today = timezone.now().date()
+
+    # General statistics, counted in a single pass over the table
+    task_stats = Task.objects.aggregate(
+        total=Count("id"),
+        completed=Count("id", filter=Q(is_completed=True)),
+        incomplete=Count("id", filter=Q(is_completed=False)),
+        overdue=Count("id", filter=Q(is_completed=False, deadline__lt=today)),
+    )
 
     # Tasks with approaching deadline (next 7 days)
-    upcoming_deadline = timezone.now().date() + timedelta(days=7)
+    upcoming_deadline = today + timedelta(days=7)
     upcoming_tasks = Task.objects.filter(
         is_completed=False,
         deadline__lte=upcoming_deadline,
-        deadline__gte=timezone.now().date(),
+        deadline__gte=today,
     ).order_by("deadline")[:5]
 
-    # Overdue tasks
-    overdue_tasks = Task.objects.filter(
-        is_completed=False, deadline__lt=timezone.now().date()
-    ).count()
-
     # My tasks
-    my_tasks = user.assigned_tasks.filter(is_completed=False).count()
-    my_completed = user.assigned_tasks.filter(is_completed=True).count()
+    my_task_stats = user.assigned_tasks.aggregate(
+        incomplete=Count("id", filter=Q(is_completed=False)),
+        completed=Count("id", filter=Q(is_completed=True)),
+    )
 
     # Priority statistics
-    priority_stats_raw = (
-        Task.objects.filter(is_completed=False)
-        .values("priority")
-        .annotate(count=Count("id"))
+    # The breakdown is the same for every user and changes slowly, so the
+    # serialised GROUP BY is cached for a minute instead of run per hit.
+    priority_stats = cache.get_or_set(
+        PRIORITY_STATS_CACHE_KEY,
+        lambda: json.dumps(
+            list(
+                Task.objects.filter(is_completed=False)
+                .values("priority")
+                .annotate(count=Count("id"))
+            )
+        ),
+        PRIORITY_STATS_CACHE_TIMEOUT,
     )
 
-    # Convert to JSON-serializable format
-    import json
-
-    priority_stats = json.dumps(list(priority_stats_raw))
-
     # Recent activity
+    # The feed only shows who did what and when; the task join the
+    # default manager adds is dropped and the user row narrowed to names.
     recent_activity = (
-        ActivityLog.objects.all()
-        .select_related("task", "user")
+        ActivityLog.objects.select_related(None)
+        .select_related("user")
+        .only(
+            "description",
+            "created_at",
+            "user__first_name",
+            "user__last_name",
+        )
         .order_by("-created_at")[:10]
     )
 
     # Projects
-    projects = Project.objects.all().prefetch_related("tasks")[:5]
+    projects = Project.objects.annotate(task_count=Count("tasks"))[:5]
 
     context = {
-        "total_tasks": total_tasks,
-        "completed_tasks": completed_tasks,
-        "incomplete_tasks": incomplete_tasks,
-        "overdue_tasks": overdue_tasks,
-        "my_tasks": my_tasks,
-        "my_completed": my_completed,
+        "total_tasks": task_stats["total"],
+        "completed_tasks": task_stats["completed"],
+        "incomplete_tasks": task_stats["incomplete"],
+        "overdue_tasks": task_stats["overdue"],
+        "my_tasks": my_task_stats["incomplete"],
+        "my_completed": my_task_stats["completed"],
         "upcoming_tasks": upcoming_tasks,
         "priority_stats": priority_stats,
         "recent_activity": recent_activity,
@@ -686,7 +793,13 @@ def dashboard(request):
 @login_required
 def task_add_comment(request, pk):
     """Add a comment to a task."""
-    task = get_object_or_404(Task, pk=pk)
+    # comment_post_save reads the assignees from this prefetch
+    task = get_object_or_404(
+        Task.objects.prefetch_related(
+            Prefetch("assignees", queryset=Worker.objects.only("id"))
+        ),
+        pk=pk,
+    )
 
     if request.method == "POST":
         form = CommentForm(request.POST)
@@ -727,9 +840,19 @@ class NotificationListView(LoginRequiredMixin, ListView):
     paginate_by = 15
 
     def get_queryset(self):
+        # The list links to the task by id only, so the task join the
+        # default manager adds is dropped and the search vector skipped.
         queryset = (
-            self.request.user.notifications.all()
-            .select_related("task")
+            self.request.user.notifications.select_related(None)
+            .only(
+                "recipient",
+                "notification_type",
+                "title",
+                "message",
+                "task",
+                "is_read",
+                "created_at",
+            )
             .order_by("-created_at")
         )
 
@@ -753,15 +876,28 @@ class NotificationListView(LoginRequiredMixin, ListView):
 def task_activity(request, pk):
     """Get task activity (for AJAX)."""
     task = get_object_or_404(Task, pk=pk)
-    activities = task.get_activity_log()
+    # Plain rows are enough for the JSON payload, so no ActivityLog or
+    # Worker instances are built per entry.
+    activities = task.get_activity_log().values(
+        "user",
+        "user__first_name",
+        "user__last_name",
+        "activity_type",
+        "description",
+        "created_at",
+    )
+    activity_types = dict(ActivityLog.ActivityType.choices)
 
     activity_list = [
         {
-            "user": activity.user.get_full_name()
-            if activity.user else "System",
-            "type": activity.get_activity_type_display(),
-            "description": activity.description,
-            "created_at": activity.created_at.strftime("%d.%m.%Y %H:%M"),
+            "user": (
+                f"{activity['user__first_name']} "
+                f"{activity['user__last_name']}".strip()
+            )
+            if activity["user"] else "System",
+            "type": activity_types[activity["activity_type"]],
+            "description": activity["description"],
+            "created_at": activity["created_at"].strftime("%d.%m.%Y %H:%M"),
         }
         for activity in activities
     ]
@@ -885,9 +1021,15 @@ class WorkerListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
             .order_by("-date_joined")
         )
 
-        # Search filtering
+        # Search filtering; on PostgreSQL the four fields are prefix-matched
+        # through the GIN-indexed search_vector in one index scan
         search = self.request.GET.get("search", "")
-        if search:
+        search_query = None
+        if search and connection.vendor == "postgresql":
+            search_query = prefix_search_query(search)
+        if search_query is not None:
+            queryset = queryset.filter(search_vector=search_query)
+        elif search:
             queryset = queryset.filter(
                 Q(username__icontains=search)
                 | Q(first_name__icontains=search)